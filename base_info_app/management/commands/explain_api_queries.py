@@ -0,0 +1,100 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from offers_orders_app.api.facets import facet_counts_queryset
+from offers_orders_app.api.filters import OfferFilter
+from offers_orders_app.api.pagination import OrderCursorPagination
+from offers_orders_app.api.stats import business_order_stats_queryset
+from offers_orders_app.models import Offer, OfferDetail, Order
+from reviews_app.models import Review
+from users_auth_app.models import UserProfile
+
+UNINDEXED_PATTERNS = {
+    'sqlite': [re.compile(r'\bSCAN \S+$'), re.compile(r'USE TEMP B-TREE')],
+    'postgresql': [re.compile(r'Seq Scan'), re.compile(r'^\s*(->\s*)?Sort\b')],
+}
+
+
+class Command(BaseCommand):
+    """
+    Prints the query plan of the queries behind each API endpoint and
+    fails if one of them scans a table or sorts without an index.
+    """
+    help = "Runs EXPLAIN for the API endpoint queries and verifies they are index-covered."
+
+    def handle(self, *args, **options):
+        patterns = UNINDEXED_PATTERNS.get(connection.vendor)
+        if patterns is None:
+            raise CommandError(
+                f"Unsupported database backend: {connection.vendor}")
+        uncovered = []
+        for label, queryset, tolerated in self.get_queries():
+            plan = queryset.explain()
+            problems = [line for line in plan.splitlines()
+                        if any(pattern.search(line) for pattern in patterns)]
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(plan)
+            if problems and tolerated:
+                self.stdout.write(self.style.WARNING(f"-> accepted: {tolerated}"))
+            elif problems:
+                uncovered.append(label)
+                self.stdout.write(self.style.ERROR("-> not index-covered"))
+            else:
+                self.stdout.write(self.style.SUCCESS("-> ok"))
+        if uncovered:
+            raise CommandError(
+                f"Queries without index coverage: {', '.join(uncovered)}")
+        self.stdout.write(self.style.SUCCESS("All endpoint queries are index-covered."))
+
+    def get_queries(self):
+        """
+        Returns `(label, queryset, tolerated)` for each endpoint query, where `tolerated`
+        explains why a scan or sort is acceptable or is None.
+        The ids are placeholders, the plans do not depend on existing rows.
+        """
+        offers = Offer.objects.order_by_nulls_last('min_price')
+        order_pages = OrderCursorPagination()
+        return [
+            ("GET /offers/", offers[:6], None),
+            ("GET /offers/?ordering=-updated_at",
+             Offer.objects.order_by_nulls_last('-updated_at')[:6], None),
+            ("GET /offers/?creator_id=", OfferFilter(
+                {'creator_id': 1}, queryset=offers).qs[:6], None),
+            ("GET /offers/?min_price=", OfferFilter(
+                {'min_price': 100}, queryset=offers).qs[:6], None),
+            ("GET /offers/?max_delivery_time=", OfferFilter(
+                {'max_delivery_time': 7}, queryset=offers).qs[:6],
+             "range on min_delivery_time, only the matching rows are sorted"),
+            ("GET /offers/facets/", facet_counts_queryset(offers),
+             "facets aggregate over all matching offers"),
+            ("GET /offers/ (details prefetch)",
+             OfferDetail.objects.filter(offer_id__in=[1, 2, 3]), None),
+            ("GET /offers/{id}/", Offer.objects.filter(pk=1), None),
+            ("GET /offerdetails/{id}/", OfferDetail.objects.filter(pk=1), None),
+            ("GET /orders/", Order.objects.filter(
+                Q(customer_user=1) | Q(business_user=1)), None),
+            ("GET /orders/?pagination=cursor",
+             order_pages.get_page_queryset(Order.objects.all(), 1, None, False, 21),
+             "only the ids of one page are sorted"),
+            ("GET /orders/?pagination=cursor&cursor=",
+             order_pages.get_page_queryset(
+                 Order.objects.all(), 1, [timezone.now(), 1], False, 21),
+             "only the ids of one page are sorted"),
+            ("GET /orders/{id}/", Order.objects.filter(pk=1), None),
+            ("GET /order-stats/{id}/ (also /order-count/, /completed-order-count/)",
+             business_order_stats_queryset(1), None),
+            ("GET /reviews/", Review.objects.all()[:20], None),
+            ("GET /reviews/?business_user_id=",
+             Review.objects.filter(business_user_id=1), None),
+            ("GET /reviews/?reviewer_id=",
+             Review.objects.filter(reviewer_id=1), None),
+            ("GET /profiles/{type}/",
+             UserProfile.objects.filter(type='business'), None),
+            ("GET /profile/{id}/", UserProfile.objects.filter(user_id=1), None),
+            ("GET /base-info/ (reviews)", Review.objects.all(),
+             "platform statistics aggregate over all reviews"),
+        ]
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from offers_orders_app.cache import invalidate_offer_cache
+from offers_orders_app.models import Offer
+from users_auth_app.models import UserProfile
+from utils.image_utils import render_image_variants
+
+IMAGE_FIELDS = [
+    (Offer, 'image', 'image_variants'),
+    (UserProfile, 'file', 'file_variants'),
+]
+
+
+class Command(BaseCommand):
+    """
+    Renders the missing thumbnails and WebP variants of offer images and profile pictures,
+    e.g. for files uploaded before the variants existed.
+    """
+    help = "Renders missing image variants for offer images and profile pictures."
+
+    def handle(self, *args, **options):
+        for model, field_name, variants_field_name in IMAGE_FIELDS:
+            rows = model.objects.exclude(
+                Q(**{f'{field_name}__isnull': True}) | Q(**{field_name: ''})
+            ).values_list('pk', field_name, variants_field_name)
+            rendered = 0
+            for pk, name, variants in rows.iterator():
+                if (variants or {}).get('source') != name:
+                    render_image_variants(model, pk, field_name, variants_field_name, name)
+                    rendered += 1
+            self.stdout.write(self.style.SUCCESS(
+                f"Rendered variants for {rendered} {model._meta.verbose_name_plural}."))
+        invalidate_offer_cache()
@@ -0,0 +1,16 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class ExplainApiQueriesCommandTests(TestCase):
+    """
+    Tests for the explain_api_queries management command.
+    """
+
+    def test_all_endpoint_queries_are_index_covered(self):
+        """Tests that the command finds an index for every endpoint query."""
+        out = StringIO()
+        call_command('explain_api_queries', stdout=out)
+        self.assertIn("All endpoint queries are index-covered.", out.getvalue())
@@ -0,0 +1,40 @@
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from offers_orders_app.models import Offer
+from users_auth_app.models import UserProfile
+from utils.test_utils import TestHelper
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_VARIANT_WIDTHS=[320])
+class GenerateImageVariantsCommandTests(TestCase):
+    """
+    Tests for the generate_image_variants management command.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def test_renders_variants_of_existing_files(self):
+        """Tests that files stored without variants get them and others are skipped."""
+        user = TestHelper.create_user(is_business=True)
+        name = default_storage.save(
+            'offer_pictures/alt.png', TestHelper.create_image_upload())
+        offer = Offer.objects.create(user=user, title="Alt", description="-")
+        Offer.objects.filter(pk=offer.pk).update(image=name)
+        out = StringIO()
+        call_command('generate_image_variants', stdout=out)
+        offer.refresh_from_db()
+        self.assertEqual(set(offer.image_variants['files']), {'320w', '320w_webp'})
+        self.assertIn("Rendered variants for 1 offers.", out.getvalue())
+        self.assertIn("Rendered variants for 0 user profiles.", out.getvalue())
+        self.assertEqual(UserProfile.objects.get(user=user).file_variants, {})
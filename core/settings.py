@@ -94,6 +94,27 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# LocMemCache is per process: with several workers, configure a shared backend
+# (e.g. Redis or Memcached) so writes invalidate cached offer listings everywhere.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'coderr',
+    }
+}
+
+# Seconds a cached offer listing is served; writes to offers invalidate it earlier.
+OFFER_LIST_CACHE_TIMEOUT = 300
+
+# Widths of the thumbnails and WebP variants rendered for uploaded images,
+# and the number of background threads rendering them.
+IMAGE_VARIANT_WIDTHS = [320, 640]
+IMAGE_VARIANT_WORKERS = 2
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -146,7 +167,7 @@ CORS_ALLOWED_ORIGINS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.TokenAuthentication',
+        'utils.authentication_utils.ProfileTokenAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
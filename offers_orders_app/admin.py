@@ -2,8 +2,9 @@ from django.contrib import admin
 
 # Register your models here.
 
-from .models import Offer, OfferDetail, Order
+from .models import BusinessOrderCounter, Offer, OfferDetail, Order
 
 admin.site.register(Offer)
 admin.site.register(OfferDetail)
 admin.site.register(Order)
+admin.site.register(BusinessOrderCounter)
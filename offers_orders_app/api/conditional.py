@@ -0,0 +1,46 @@
+from utils.conditional_utils import cached_validator, make_etag
+from ..models import Offer, OfferDetail
+
+
+OFFER_STATE_FIELDS = ['updated_at', 'user_id', 'title', 'image', 'image_variants',
+                      'description', 'min_price', 'min_delivery_time']
+
+
+def _offer_state(request, pk):
+    """
+    Loads the rendered columns of an offer and the ids of its details with one query.
+    The ETag is built from all of them, so writes that skip `updated_at` still change it.
+    """
+    def load():
+        rows = list(Offer.objects.filter(pk=pk).values_list(
+            *OFFER_STATE_FIELDS, 'details__id'
+        ).order_by('details__id'))
+        if not rows:
+            return None
+        columns = rows[0][:-1]
+        detail_ids = [row[-1] for row in rows if row[-1] is not None]
+        return *columns, detail_ids
+    return cached_validator(request, f'offer:{pk}', load)
+
+
+def offer_etag(request, pk=None, **kwargs):
+    """Returns the ETag of an offer or None if it does not exist."""
+    state = _offer_state(request, pk)
+    return make_etag('offer', pk, *state) if state else None
+
+
+def offer_last_modified(request, pk=None, **kwargs):
+    """Returns the last modification time of an offer or None if it does not exist."""
+    state = _offer_state(request, pk)
+    return state[0] if state else None
+
+
+def offer_detail_etag(request, pk=None, **kwargs):
+    """
+    Returns the ETag of an offer detail built from its stored values,
+    or None if it does not exist. Offer details carry no timestamp.
+    """
+    values = OfferDetail.objects.filter(pk=pk).values_list(
+        'title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type'
+    ).first()
+    return make_etag('offer-detail', pk, values) if values else None
@@ -0,0 +1,55 @@
+from django.db.models import Case, Count, IntegerField, Value, When
+
+PRICE_BOUNDS = [50, 100, 250, 500, 1000]
+DELIVERY_TIME_BOUNDS = [2, 4, 8, 15, 31]
+
+
+def bucket_case(field, bounds):
+    """
+    Returns an expression numbering the bucket of `field`: 0 below the first bound,
+    `len(bounds)` from the last bound on, NULL if the field is NULL.
+    """
+    whens = [When(**{f'{field}__lt': bound}, then=Value(index))
+             for index, bound in enumerate(bounds)]
+    whens.append(When(**{f'{field}__isnull': False}, then=Value(len(bounds))))
+    return Case(*whens, default=None, output_field=IntegerField())
+
+
+def build_buckets(bounds, counts):
+    """
+    Returns the buckets as `{'from', 'to', 'count'}` dicts, `from` inclusive and
+    `to` exclusive, with None for the open ends.
+    """
+    edges = [None] + list(bounds) + [None]
+    return [{'from': edges[index], 'to': edges[index + 1], 'count': counts.get(index, 0)}
+            for index in range(len(bounds) + 1)]
+
+
+def facet_counts_queryset(queryset, price_bounds=PRICE_BOUNDS,
+                          delivery_time_bounds=DELIVERY_TIME_BOUNDS):
+    """
+    Returns the grouped query counting offers per (price bucket, delivery time bucket).
+    """
+    return queryset.order_by().annotate(
+        price_bucket=bucket_case('min_price', price_bounds),
+        delivery_time_bucket=bucket_case('min_delivery_time', delivery_time_bounds),
+    ).values('price_bucket', 'delivery_time_bucket').annotate(count=Count('id'))
+
+
+def offer_facets(queryset, price_bounds=PRICE_BOUNDS, delivery_time_bounds=DELIVERY_TIME_BOUNDS):
+    """
+    Counts the offers of the queryset per bucket of the stored minimum price and
+    minimum delivery time, using one grouped query for both facets.
+    Offers without details have no minimum values and are not counted.
+    """
+    rows = facet_counts_queryset(queryset, price_bounds, delivery_time_bounds)
+    price_counts, delivery_time_counts = {}, {}
+    for row in rows:
+        price_counts[row['price_bucket']] = price_counts.get(
+            row['price_bucket'], 0) + row['count']
+        delivery_time_counts[row['delivery_time_bucket']] = delivery_time_counts.get(
+            row['delivery_time_bucket'], 0) + row['count']
+    return {
+        'price': build_buckets(price_bounds, price_counts),
+        'delivery_time': build_buckets(delivery_time_bounds, delivery_time_counts),
+    }
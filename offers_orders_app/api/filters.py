@@ -1,6 +1,9 @@
-from django_filters.rest_framework import FilterSet, NumberFilter
+from django.db.models import Exists, OuterRef
+from django_filters.rest_framework import ChoiceFilter, FilterSet, NumberFilter
+from rest_framework.filters import OrderingFilter, SearchFilter
 
-from ..models import Offer
+from ..models import Offer, OfferDetail, Order
+from ..search import get_search_backend, split_words
 
 
 class OfferFilter(FilterSet):
@@ -21,11 +24,59 @@ class OfferFilter(FilterSet):
     def filter_min_price(self, queryset, name, value):
         """
         Filters offers where the price is greater than or equal to the given value.
+        Uses a correlated EXISTS on the (offer, price) index so each offer appears once.
         """
-        return queryset.filter(details__price__gte=value)
+        return queryset.filter(Exists(OfferDetail.objects.filter(
+            offer=OuterRef('pk'), price__gte=value)))
 
     def filter_max_delivery_time(self, queryset, name, value):
         """
         Filters offers where the delivery time is less than or equal to the given value.
+        An offer matches if its fastest detail does, so the stored minimum is sufficient.
         """
-        return queryset.filter(details__delivery_time_in_days__lte=value)
+        return queryset.filter(min_delivery_time__lte=value)
+
+
+class OrderFilter(FilterSet):
+    """
+    A filter class for the Order model, allowing filtering by:
+    - `status`: One of the order status choices; other values are rejected with 400.
+    """
+    status = ChoiceFilter(choices=Order.STATUS_CHOICES)
+
+    class Meta:
+        model = Order
+        fields = ['status']
+
+
+class OfferOrderingFilter(OrderingFilter):
+    """
+    Applies `?ordering=` with offers without a stored value last in both directions,
+    so page number and keyset pagination return offers in the same order.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if ordering:
+            return queryset.order_by_nulls_last(*ordering)
+        return queryset
+
+
+class OfferSearchFilter(SearchFilter):
+    """
+    Searches offers through the full-text index of the database backend and ranks them by relevance.
+    An explicit `ordering` parameter takes precedence over the relevance ranking.
+    Falls back to the default `LIKE` search if the database has no full-text backend
+    or the terms contain no words, e.g. only punctuation.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        backend = get_search_backend()
+        words = split_words(search_terms) if search_terms else []
+        if not words or backend is None:
+            return super().filter_queryset(request, queryset, view)
+        queryset = backend.search(queryset, words)
+        if request.query_params.get('ordering'):
+            return queryset
+        return queryset.order_by(backend.rank_ordering, 'id')
@@ -1,8 +1,82 @@
 from rest_framework.pagination import PageNumberPagination
 
+from utils.pagination_utils import KeysetPagination
+
 
 class OfferPagination(PageNumberPagination):
     """Custom pagination class that allows dynamic page size via query parameter."""
     page_size = 6
     page_size_query_param = 'page_size'
     max_page_size = 10000
+
+
+class OfferCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for offers, enabled with `?pagination=cursor`.
+    Pages are keyed on (`min_price`, `id`) or (`updated_at`, `id`) depending on the `ordering` parameter.
+    """
+    page_size = 6
+    max_page_size = 100
+    ordering_param = 'ordering'
+    ordering_fields = ['min_price', 'updated_at']
+    default_ordering = 'min_price'
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the first valid term of the `ordering` parameter with `id` as tie-breaker.
+        """
+        terms = request.query_params.get(self.ordering_param, '').split(',')
+        for term in terms:
+            term = term.strip()
+            field = term.lstrip('-')
+            if field in self.ordering_fields:
+                descending = term.startswith('-')
+                return [(field, descending), ('id', descending)]
+        return [(self.default_ordering, False), ('id', False)]
+
+
+class OrderCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for the orders of the current user, enabled with `?pagination=cursor`.
+    Pages are keyed on (`-created_at`, `-id`). Each page is read as a UNION of one
+    lookup per `union_fields` entry, so both branches seek on their own
+    (user, `created_at`, `id`) index instead of scanning an OR condition.
+    The view provides the filtered orders without the user condition via `get_base_queryset()`.
+    """
+    page_size = 20
+    max_page_size = 100
+    union_fields = ['customer_user', 'business_user']
+    ordering = [('created_at', True), ('id', True)]
+    nullable = set()
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Remembers the view's orders without the user condition for the page query."""
+        self.base_queryset = view.filter_queryset(view.get_base_queryset())
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_page_rows(self, queryset, position, reverse, limit):
+        return list(self.get_page_queryset(
+            self.base_queryset, self.request.user, position, reverse, limit))
+
+    def get_page_queryset(self, queryset, user, position, reverse, limit):
+        """
+        Returns the page query: the page ids come from the union of the per-user
+        branches, each limited to `limit` rows, and the rows are loaded by id in page order.
+        `queryset` must not contain the OR over both users, otherwise the outer query
+        reads all orders of the user before the id list is applied.
+        """
+        branch_queryset = queryset
+        if position is not None:
+            branch_queryset = queryset.filter(self.get_position_filter(position, reverse))
+        order_by = self.get_order_by(reverse)
+        branches = [
+            queryset.model.objects.filter(pk__in=branch_queryset.filter(
+                **{field: user}).order_by(*order_by).values('pk')[:limit]
+            ).values('pk')
+            for field in self.union_fields
+        ]
+        page_ids = branches[0].union(*branches[1:])
+        return queryset.filter(pk__in=page_ids).order_by(*order_by)[:limit]
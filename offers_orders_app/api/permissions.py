@@ -7,4 +7,4 @@ class IsOrderBusinessOwner(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return getattr(obj, "business_user", None) == request.user
+        return getattr(obj, "business_user_id", None) == request.user.pk
@@ -1,12 +1,20 @@
 
+from functools import cached_property, lru_cache
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.urls import reverse
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.urls import get_script_prefix, get_urlconf, reverse
 from rest_framework.exceptions import ValidationError, NotFound
 
 from rest_framework import serializers
 
+from ..cache import invalidate_offer_cache
 from ..models import Offer, OfferDetail, Order
+from ..search import get_search_backend
+from utils.image_utils import ImageVariantsField, image_variant_urls
+from utils.serializer_utils import SparseFieldsetMixin, get_context_request, get_sparse_fieldset
 
 
 ############### OFFERS###############
@@ -33,6 +41,37 @@ class OfferDetailSerializer(serializers.ModelSerializer):
                   'delivery_time_in_days', 'price', 'features', 'offer_type']
 
 
+OFFER_DETAIL_URL_PLACEHOLDER = 987654321
+
+
+@lru_cache(maxsize=None)
+def _offer_detail_url_parts(script_prefix, urlconf):
+    """
+    Reverses the offer detail URL once with a placeholder id and returns the text
+    before and after the id. Cached per script prefix and URLconf.
+    """
+    url = reverse('offer-details', urlconf=urlconf,
+                  kwargs={'pk': OFFER_DETAIL_URL_PLACEHOLDER})
+    prefix, suffix = url.replace('/api', '', 1).split(
+        str(OFFER_DETAIL_URL_PLACEHOLDER))
+    return prefix, suffix
+
+
+def get_offer_detail_url_parts():
+    """Returns the offer detail URL parts for the active script prefix and URLconf."""
+    return _offer_detail_url_parts(
+        get_script_prefix(), get_urlconf() or settings.ROOT_URLCONF)
+
+
+def offer_detail_url(pk, parts=None):
+    """
+    Returns the relative URL of an offer detail as exposed in offer listings.
+    Pass `parts` from `get_offer_detail_url_parts` when building many URLs at once.
+    """
+    prefix, suffix = parts or get_offer_detail_url_parts()
+    return f'{prefix}{pk}{suffix}'
+
+
 class OfferDetailHyperlinkedSerializer(serializers.HyperlinkedModelSerializer):
     """
     Serializes offer details with a hyperlink to the detail view.
@@ -43,34 +82,159 @@ class OfferDetailHyperlinkedSerializer(serializers.HyperlinkedModelSerializer):
         model = OfferDetail
         fields = ['id', 'url']
 
+    @cached_property
+    def url_parts(self):
+        return get_offer_detail_url_parts()
+
     def get_url(self, obj):
-        url = reverse('offer-details', kwargs={'pk': obj.pk})
-        return url.replace('/api', '', 1)
+        return offer_detail_url(obj.pk, self.url_parts)
 
 
-class OfferListSerializer(serializers.ModelSerializer):
+class OfferListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
-    Serializes a list of offers with user details, associated offer details, and calculated minimum price and delivery time.
+    Serializes a list of offers with user details, associated offer details, and the stored minimum price and delivery time.
     """
     user_details = UserDetailsSerializer(source="user", read_only=True)
     details = OfferDetailHyperlinkedSerializer(
         many=True, read_only=True)
+    image_variants = ImageVariantsField(
+        storage=Offer._meta.get_field('image').storage)
 
-    min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
+    sparse_field_columns = {
+        'details': [],
+        'user_details': ['user__first_name', 'user__last_name', 'user__username'],
+    }
 
     class Meta:
         model = Offer
-        fields = ['id', 'user', 'title', 'image', 'description', 'created_at',
+        fields = ['id', 'user', 'title', 'image', 'image_variants', 'description', 'created_at',
                   'updated_at', 'details', 'min_price', 'min_delivery_time', 'user_details']
 
-    def get_min_price(self, obj):
-        """Calculates the minimum price of the associated offer details."""
-        return obj.details.aggregate(models.Min("price"))["price__min"]
 
-    def get_min_delivery_time(self, obj):
-        """Calculates the minimum delivery time in days of the associated offer details."""
-        return obj.details.aggregate(models.Min("delivery_time_in_days"))["delivery_time_in_days__min"]
+class OfferListValuesListSerializer(serializers.ListSerializer):
+    """
+    Loads the detail ids of all offers on the page with one query
+    before the rows are serialized.
+    """
+
+    def to_representation(self, data):
+        rows = list(data)
+        if 'details' in self.child.output_fields:
+            self._add_detail_ids(rows)
+        return [self.child.to_representation(row) for row in rows]
+
+    def _add_detail_ids(self, rows):
+        """Sets `detail_ids` on every row."""
+        detail_ids = {row['id']: [] for row in rows}
+        details = OfferDetail.objects.filter(
+            offer_id__in=detail_ids).order_by('id').values_list('offer_id', 'id')
+        for offer_id, detail_id in details:
+            detail_ids[offer_id].append(detail_id)
+        for row in rows:
+            row['detail_ids'] = detail_ids[row['id']]
+
+
+class OfferListValuesSerializer(serializers.BaseSerializer):
+    """
+    Read-only fast path for the offer list that builds the response directly from `values()` rows.
+    Produces the same output as `OfferListSerializer` without per-field serializer overhead,
+    including its sparse fieldsets.
+    """
+    FIELDS = OfferListSerializer.Meta.fields
+    FIELD_VALUES = {**OfferListSerializer.sparse_field_columns, 'user': ['user_id']}
+    REQUIRED_VALUES = ['id', 'min_price', 'updated_at']
+
+    datetime_field = serializers.DateTimeField()
+    image_storage = Offer._meta.get_field('image').storage
+
+    class Meta:
+        list_serializer_class = OfferListValuesListSerializer
+
+    @classmethod
+    def get_sparse_fields(cls, request):
+        """Returns the selected field names, or None for the full representation."""
+        return get_sparse_fieldset(request, cls.FIELDS)
+
+    @classmethod
+    def get_values_queryset(cls, queryset, fields=None):
+        """
+        Returns the queryset restricted to the columns the given fields read.
+        The ids and the cursor ordering columns are always loaded.
+        """
+        values = list(cls.REQUIRED_VALUES)
+        for name in cls.FIELDS if fields is None else fields:
+            values += [value for value in cls.FIELD_VALUES.get(name, [name])
+                       if value not in values]
+        return queryset.values(*values)
+
+    @cached_property
+    def output_fields(self):
+        """Returns the names of the fields to render, honouring `?fields=` / `?omit=`."""
+        selected = self.get_sparse_fields(get_context_request(self.context))
+        return self.FIELDS if selected is None else selected
+
+    @cached_property
+    def field_getters(self):
+        return [(name, getattr(self, f'_get_{name}')) for name in self.output_fields]
+
+    @cached_property
+    def url_parts(self):
+        return get_offer_detail_url_parts()
+
+    def to_representation(self, row):
+        return {name: getter(row) for name, getter in self.field_getters}
+
+    def _get_id(self, row):
+        return row['id']
+
+    def _get_user(self, row):
+        return row['user_id']
+
+    def _get_title(self, row):
+        return row['title']
+
+    def _get_image(self, row):
+        return self._image_url(row['image'])
+
+    def _get_image_variants(self, row):
+        return image_variant_urls(
+            row['image_variants'], self.image_storage, self.context.get('request'))
+
+    def _get_description(self, row):
+        return row['description']
+
+    def _get_created_at(self, row):
+        return self.datetime_field.to_representation(row['created_at'])
+
+    def _get_updated_at(self, row):
+        return self.datetime_field.to_representation(row['updated_at'])
+
+    def _get_details(self, row):
+        return [{'id': detail_id, 'url': offer_detail_url(detail_id, self.url_parts)}
+                for detail_id in row['detail_ids']]
+
+    def _get_min_price(self, row):
+        min_price = row['min_price']
+        return float(min_price) if min_price is not None else None
+
+    def _get_min_delivery_time(self, row):
+        min_delivery_time = row['min_delivery_time']
+        return int(min_delivery_time) if min_delivery_time is not None else None
+
+    def _get_user_details(self, row):
+        return {
+            'first_name': row['user__first_name'],
+            'last_name': row['user__last_name'],
+            'username': row['user__username'],
+        }
+
+    def _image_url(self, name):
+        """Returns the image URL like DRF's ImageField does, absolute if a request is available."""
+        if not name:
+            return None
+        url = self.image_storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
 
 
 class OfferRetrieveSerializer(OfferListSerializer, serializers.ModelSerializer):
@@ -85,6 +249,51 @@ class OfferRetrieveSerializer(OfferListSerializer, serializers.ModelSerializer):
                   'updated_at', 'details', 'min_price', 'min_delivery_time']
 
 
+class OfferExportSerializer(serializers.ModelSerializer):
+    """
+    Serializes an offer with its full details and stored minimum values for the bulk export.
+    """
+    details = OfferDetailSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Offer
+        fields = ['id', 'user', 'title', 'image', 'description', 'created_at',
+                  'updated_at', 'min_price', 'min_delivery_time', 'details']
+
+
+class OfferEditListSerializer(serializers.ListSerializer):
+    """
+    Creates many offers at once with one bulk INSERT for the offers and one for all details.
+    """
+
+    def create(self, validated_data):
+        """
+        Inserts all offers and their details in one transaction.
+        bulk_create sends no signals, so the minimum values, the search index
+        and the offer cache are maintained here.
+        """
+        details_per_offer = [item.pop('details', []) for item in validated_data]
+        offers = [
+            Offer(**item, **self.child._get_min_values(
+                [detail['price'] for detail in details],
+                [detail['delivery_time_in_days'] for detail in details]))
+            for item, details in zip(validated_data, details_per_offer)
+        ]
+        with transaction.atomic():
+            Offer.objects.bulk_create(offers)
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, **detail)
+                for offer, details in zip(offers, details_per_offer)
+                for detail in details
+            ])
+            backend = get_search_backend()
+            if backend is not None:
+                backend.index_offers(offers)
+            invalidate_offer_cache()
+        prefetch_related_objects(offers, 'details')
+        return offers
+
+
 class OfferEditSerializer(serializers.ModelSerializer):
     """
     Serializes offer data for creation or update, including validation for associated offer details.
@@ -95,6 +304,7 @@ class OfferEditSerializer(serializers.ModelSerializer):
         model = Offer
         fields = ['id', 'title', 'image', 'description', 'details']
         read_only_fields = ['id']
+        list_serializer_class = OfferEditListSerializer
 
     def validate_details(self, value):
         """Validates presence, length, and type of offer details."""
@@ -134,44 +344,86 @@ class OfferEditSerializer(serializers.ModelSerializer):
             )
 
     def create(self, validated_data):
-        """Creates an offer with associated details."""
+        """
+        Creates an offer with associated details in one transaction.
+        The minimum values are computed from the payload, so the details
+        can be inserted with a single bulk_create.
+        """
         details = validated_data.pop('details', [])
-        offer = Offer.objects.create(**validated_data)
-        self._create_details(details, offer)
+        with transaction.atomic():
+            offer = Offer.objects.create(**validated_data, **self._get_min_values(
+                [detail['price'] for detail in details],
+                [detail['delivery_time_in_days'] for detail in details]))
+            self._create_details(details, offer)
         return offer
 
+    def _get_min_values(self, prices, delivery_times):
+        """Returns the stored minimum price and delivery time for the given detail values."""
+        return {
+            'min_price': min(prices, default=None),
+            'min_delivery_time': min(delivery_times, default=None),
+        }
+
     def _create_details(self, details, offer):
-        """Creates related offer detail instances."""
-        for detail in details:
-            OfferDetail.objects.create(offer=offer, **detail)
+        """Creates related offer detail instances with one INSERT."""
+        OfferDetail.objects.bulk_create(
+            [OfferDetail(offer=offer, **detail) for detail in details])
 
     def update(self, instance, validated_data):
-        """Updates offer and related details by ID."""
+        """
+        Updates offer and related details by ID in one transaction.
+        Only changed detail columns are written, with a single bulk_update.
+        """
         details_data = validated_data.pop('details', None)
-        self._update_offer_fields(instance, validated_data)
-        if details_data is not None:
-            self._update_offer_details(instance, details_data)
+        update_fields = list(validated_data)
+        with transaction.atomic():
+            if details_data is not None:
+                update_fields += self._update_offer_details(instance, details_data)
+            self._update_offer_fields(instance, validated_data, update_fields)
         return instance
 
-    def _update_offer_fields(self, instance, validated_data):
-        """Updates basic fields of the offer."""
+    def _update_offer_fields(self, instance, validated_data, update_fields):
+        """Updates basic fields of the offer, writing only `update_fields`."""
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=update_fields)
 
     def _update_offer_details(self, instance, details_data):
         """
         Updates existing offer details based on the `offer_type`.
+        Returns the offer fields changed as a result, i.e. the stored minimum values.
         """
         existing_details = self._get_existing_details(instance)
         valid_types = self._get_valid_offer_types()
 
+        changed_details, changed_fields = [], set()
         for detail_data in details_data:
             self._validate_offer_type(detail_data, valid_types)
             detail_instance = self._get_detail_instance(
                 existing_details, detail_data)
             self._validate_detail_immutability(detail_instance, detail_data)
-            self._apply_detail_updates(detail_instance, detail_data)
+            fields = self._apply_detail_updates(detail_instance, detail_data)
+            if fields:
+                changed_details.append(detail_instance)
+                changed_fields.update(fields)
+        if not changed_details:
+            return []
+        OfferDetail.objects.bulk_update(changed_details, sorted(changed_fields))
+        return self._apply_min_values(instance, existing_details.values())
+
+    def _apply_min_values(self, instance, details):
+        """
+        Sets the stored minimum values from the details, which are not updated by
+        signals after bulk_update. Returns the offer fields that changed.
+        """
+        min_values = self._get_min_values(
+            [detail.price for detail in details],
+            [detail.delivery_time_in_days for detail in details])
+        changed = [field for field, value in min_values.items()
+                   if getattr(instance, field) != value]
+        for field in changed:
+            setattr(instance, field, min_values[field])
+        return changed
 
     def _get_existing_details(self, instance):
         """
@@ -245,31 +497,26 @@ class OfferEditSerializer(serializers.ModelSerializer):
 
     def _apply_detail_updates(self, instance, detail_data):
         """
-        Applies field updates to an existing detail instance.
+        Applies field updates to an existing detail instance without saving it.
+        Returns the names of the fields whose value changed.
         """
+        changed = []
         for attr, value in detail_data.items():
             if attr == "id" or attr == "offer_type":
                 continue  # Skip immutable fields
-            setattr(instance, attr, value)
-        instance.save()
+            if getattr(instance, attr) != value:
+                setattr(instance, attr, value)
+                changed.append(attr)
+        return changed
 
 ############### ORDERS###############
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
-    Serializes order data with details from the associated offer, including title, revisions, delivery time, and price.
+    Serializes order data with the package bought from the offer: title, revisions,
+    delivery time, price, features and offer type, as copied onto the order at creation.
     """
-    title = serializers.CharField(source='offer_detail.title', read_only=True)
-    revisions = serializers.IntegerField(
-        source='offer_detail.revisions', read_only=True)
-    delivery_time_in_days = serializers.IntegerField(
-        source='offer_detail.delivery_time_in_days', read_only=True)
-    price = serializers.FloatField(source='offer_detail.price', read_only=True)
-    features = serializers.JSONField(
-        source='offer_detail.features', read_only=True)
-    offer_type = serializers.CharField(
-        source='offer_detail.offer_type', read_only=True)
 
     class Meta:
         model = Order
@@ -278,5 +525,19 @@ class OrderSerializer(serializers.ModelSerializer):
             'delivery_time_in_days', 'price', 'features', 'offer_type',
             'status', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'customer_user',
-                            'business_user', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'customer_user', 'business_user', 'title', 'revisions',
+                            'delivery_time_in_days', 'price', 'features', 'offer_type',
+                            'created_at', 'updated_at']
+
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """
+    Validates a bulk status change: the ids of the orders and their new status.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=100)
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+
+    def validate_ids(self, value):
+        """Removes duplicate ids while keeping their order."""
+        return list(dict.fromkeys(value))
@@ -0,0 +1,29 @@
+from users_auth_app.models import User
+from ..models import Order
+
+ORDER_STATUSES = [value for value, _ in Order.STATUS_CHOICES]
+
+
+def business_order_stats_queryset(business_user_id):
+    """
+    Returns the query reading the order counters of a business user.
+    The profile join validates the user; the counters are left joined, so a business
+    user without orders yields a single row with a NULL status.
+    """
+    return User.objects.filter(
+        id=business_user_id, userprofile__type='business',
+    ).values('order_counters__status', 'order_counters__count')
+
+
+def business_order_stats(business_user_id):
+    """
+    Returns the number of orders per status and in total for a business user,
+    or None if no business user with this id exists.
+    """
+    rows = business_order_stats_queryset(business_user_id)
+    counts = {row['order_counters__status']: row['order_counters__count'] for row in rows}
+    if not counts:
+        return None
+    stats = {order_status: counts.get(order_status, 0) for order_status in ORDER_STATUSES}
+    stats['total'] = sum(stats.values())
+    return stats
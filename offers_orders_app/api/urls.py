@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import OfferViewSet, OfferDetailsRetrieveAPIView, OrderListCreateAPIView, OrderRetrieveUpdateDestroyAPIView, OrderCountView, CompletedOrderCountView
+from .views import OfferViewSet, OfferDetailsRetrieveAPIView, OrderListCreateAPIView, OrderRetrieveUpdateDestroyAPIView, OrderCountView, CompletedOrderCountView, OrderStatsView, OrderBulkStatusUpdateAPIView
 
 router = DefaultRouter()
 router.register(r'offers', OfferViewSet, basename='offer')
@@ -10,11 +10,15 @@ urlpatterns = [
     path('offerdetails/<int:pk>/', OfferDetailsRetrieveAPIView.as_view(),
          name='offer-details'),
     path('orders/', OrderListCreateAPIView.as_view(), name='order-list-create'),
+    path('orders/bulk-status/', OrderBulkStatusUpdateAPIView.as_view(),
+         name='order-bulk-status'),
     path('orders/<int:pk>/', OrderRetrieveUpdateDestroyAPIView.as_view(),
          name='order-detail'),
     path('order-count/<int:business_user_id>/',
          OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/',
          CompletedOrderCountView.as_view(), name='completed-order-count'),
+    path('order-stats/<int:business_user_id>/',
+         OrderStatsView.as_view(), name='order-stats'),
 
 ]
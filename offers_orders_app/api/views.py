@@ -1,20 +1,29 @@
-from django.db import models
-from django.db.models import Min
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework import viewsets, generics, filters, status
+from rest_framework import viewsets, generics, status
+from rest_framework.decorators import action
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated, IsAdminUser
 from rest_framework.exceptions import ValidationError, NotFound
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from users_auth_app.models import User
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from utils.permission_utils import IsBusinessUser, IsOwner, IsCustomerUser
-from ..models import Offer, OfferDetail, Order
-from .serializers import OfferDetailSerializer, OfferRetrieveSerializer, OfferListSerializer, OfferEditSerializer, OrderSerializer
-from .filters import OfferFilter
-from .pagination import OfferPagination
+from ..cache import get_offer_cache, offer_cache_key
+from ..models import BusinessOrderCounter, Offer, OfferDetail, Order
+from .serializers import OfferDetailSerializer, OfferRetrieveSerializer, OfferListValuesSerializer, OfferEditSerializer, OfferExportSerializer, OrderSerializer, OrderBulkStatusSerializer
+from .filters import OfferFilter, OfferOrderingFilter, OfferSearchFilter, OrderFilter
+from .pagination import OfferPagination, OfferCursorPagination, OrderCursorPagination
 from .permissions import IsOrderBusinessOwner
+from .conditional import offer_etag, offer_last_modified, offer_detail_etag
+from .facets import offer_facets
+from .stats import business_order_stats
 
 ############### OFFERS###############
 
@@ -25,21 +34,36 @@ class OfferViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [IsAuthenticatedOrReadOnly]
     filter_backends = [DjangoFilterBackend,
-                       filters.OrderingFilter, filters.SearchFilter]
+                       OfferOrderingFilter, OfferSearchFilter]
     filterset_class = OfferFilter
     ordering_fields = ['updated_at', 'min_price']
     search_fields = ['title', 'description']
     pagination_class = OfferPagination
+    export_chunk_size = 500
+    bulk_create_max_offers = 100
+
+    @property
+    def paginator(self):
+        """
+        Returns the keyset paginator when `?pagination=cursor` is requested,
+        otherwise the page number paginator.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = OfferCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_permissions(self):
         """
         Returns custom permissions based on the action type.
         """
-        if self.action == 'create':
+        if self.action in ['create', 'bulk_create']:
             return [IsAuthenticated(), IsBusinessUser()]
         if self.action in ['update', 'partial_update', 'destroy']:
             return [IsAuthenticated(), IsOwner()]
-        if self.action == 'retrieve':
+        if self.action in ['retrieve', 'export']:
             return [IsAuthenticated()]
         return [IsAuthenticatedOrReadOnly()]
 
@@ -48,18 +72,110 @@ class OfferViewSet(viewsets.ModelViewSet):
         Returns the appropriate serializer class based on the action.
         """
         if self.action == 'list':
-            return OfferListSerializer
+            return OfferListValuesSerializer
         if self.action == 'retrieve':
             return OfferRetrieveSerializer
+        if self.action == 'export':
+            return OfferExportSerializer
         return OfferEditSerializer
 
     def get_queryset(self):
         """
-        Annotates offers with `min_price` and sorts them for pagination stability.
+        Builds the queryset for the current action.
+        Lists read plain `values()` rows sorted by the stored `min_price` and `id` for
+        pagination stability, offers without details last as in keyset pagination. Single-offer actions use a plain primary key lookup with only the
+        prefetches their serializer needs: detail ids for retrieve, full details for updates.
+        Reads only load what the requested sparse fieldset renders.
+        """
+        if self.action == 'list':
+            return OfferListValuesSerializer.get_values_queryset(
+                Offer.objects.order_by_nulls_last('min_price'),
+                OfferListValuesSerializer.get_sparse_fields(self.request))
+        queryset = Offer.objects.all()
+        if self.action == 'retrieve':
+            fields = OfferRetrieveSerializer.get_sparse_fields(self.request)
+            if fields is None or 'details' in fields:
+                queryset = queryset.prefetch_related(
+                    Prefetch('details', queryset=OfferDetail.objects.only(
+                        'id', 'offer_id').order_by('id'))
+                )
+            queryset = OfferRetrieveSerializer.get_sparse_queryset(
+                queryset, self.request)
+        elif self.action in ['update', 'partial_update']:
+            queryset = queryset.prefetch_related('details')
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serves the offer list from the cache until an offer or offer detail changes.
+        """
+        cache = get_offer_cache()
+        cache_key = offer_cache_key('list', request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data,
+                  getattr(settings, 'OFFER_LIST_CACHE_TIMEOUT', 300))
+        return response
+
+    @method_decorator(condition(etag_func=offer_etag, last_modified_func=offer_last_modified))
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns a single offer, or 304 Not Modified if the client's copy is current.
+        """
+        return super().retrieve(request, *args, **kwargs)
+
+    @action(detail=False, methods=['get'], url_path='facets')
+    def facets(self, request):
+        """
+        Returns offer counts per minimum price and minimum delivery time bucket for the
+        offers matching the current filters and search, computed with one grouped query.
+        Cached per filter combination until an offer or offer detail changes.
+        """
+        cache = get_offer_cache()
+        cache_key = offer_cache_key('facets', request)
+        data = cache.get(cache_key)
+        if data is None:
+            data = offer_facets(self.filter_queryset(self.get_queryset()))
+            cache.set(cache_key, data,
+                      getattr(settings, 'OFFER_LIST_CACHE_TIMEOUT', 300))
+        return Response(data)
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Streams the whole offer catalogue as newline-delimited JSON, one offer with its details per line.
+        Offers are read in chunks, so memory use does not grow with the catalogue size.
+        """
+        queryset = Offer.objects.order_by('id').prefetch_related('details')
+        serializer = self.get_serializer()
+        return StreamingHttpResponse(
+            self._export_lines(queryset, serializer),
+            content_type='application/x-ndjson'
+        )
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        """
+        Creates up to `bulk_create_max_offers` offers from a list in the offer creation format.
+        All offers are validated first; if any is invalid nothing is created and the
+        errors are returned as a list in request order, with `{}` for valid offers.
+        """
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False,
+            max_length=self.bulk_create_max_offers)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def _export_lines(self, queryset, serializer):
         """
-        return Offer.objects.annotate(
-            min_price=Min('details__price')
-        ).order_by('min_price')
+        Yields one serialized JSON line per offer.
+        """
+        encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        for offer in queryset.iterator(chunk_size=self.export_chunk_size):
+            yield encoder.encode(serializer.to_representation(offer)) + '\n'
 
     def perform_create(self, serializer):
         """
@@ -82,16 +198,39 @@ class OfferDetailsRetrieveAPIView(generics.RetrieveAPIView):
     serializer_class = OfferDetailSerializer
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(condition(etag_func=offer_detail_etag))
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the offer detail, or 304 Not Modified if the client's copy is current.
+        """
+        return super().get(request, *args, **kwargs)
+
 
 ############### ORDERS###############
 
 class OrderListCreateAPIView(generics.ListCreateAPIView):
     """
     Handles GET /orders/ and POST /orders/
+    Lists are unpaginated unless `?pagination=cursor` is given and can be filtered by `status`.
     """
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = OrderFilter
+
+    @property
+    def paginator(self):
+        """
+        Returns the keyset paginator when `?pagination=cursor` is requested,
+        otherwise None so the full list is returned.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = OrderCursorPagination()
+            else:
+                self._paginator = None
+        return self._paginator
 
     def get_permissions(self):
         """
@@ -106,10 +245,17 @@ class OrderListCreateAPIView(generics.ListCreateAPIView):
         Returns orders where the current user is either the customer or the business user.
         """
         user = self.request.user
-        return Order.objects.filter(
+        return self.get_base_queryset().filter(
             models.Q(customer_user=user) | models.Q(business_user=user)
         )
 
+    def get_base_queryset(self):
+        """
+        Returns all orders restricted to the requested sparse fieldset.
+        The cursor pagination restricts them to the current user per branch.
+        """
+        return OrderSerializer.get_sparse_queryset(Order.objects.all(), self.request)
+
     def perform_create(self, serializer):
         """
         Handles order creation and associates the correct users and offer detail.
@@ -118,11 +264,12 @@ class OrderListCreateAPIView(generics.ListCreateAPIView):
         user = self.request.user
         offer_detail_id = self._get_offer_detail_id()
         offer_detail = self._get_offer_detail(offer_detail_id)
-        serializer.save(
-            customer_user=user,
-            business_user=offer_detail.offer.user,
-            offer_detail=offer_detail
-        )
+        with transaction.atomic():
+            serializer.save(
+                customer_user=user,
+                business_user_id=offer_detail.business_user_id,
+                offer_detail=offer_detail
+            )
 
     def _get_offer_detail_id(self):
         """
@@ -148,11 +295,13 @@ class OrderListCreateAPIView(generics.ListCreateAPIView):
 
     def _get_offer_detail(self, offer_detail_id_int):
         """
-        Retrieves the OfferDetail object by ID.
+        Retrieves the OfferDetail object by ID together with the id of the offer's owner
+        as `business_user_id`.
         Raises NotFound if the object does not exist.
         """
         try:
-            return OfferDetail.objects.get(id=offer_detail_id_int)
+            return OfferDetail.objects.annotate(
+                business_user_id=models.F('offer__user_id')).get(id=offer_detail_id_int)
         except OfferDetail.DoesNotExist:
             raise NotFound(
                 {"offer_detail_id": "The specified offer detail does not exist."})
@@ -165,6 +314,19 @@ class OrderRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
 
+    def get_queryset(self):
+        """
+        Loads only the columns of the requested sparse fieldset on GET.
+        """
+        return OrderSerializer.get_sparse_queryset(super().get_queryset(), self.request)
+
+    def perform_update(self, serializer):
+        """
+        Saves the order together with the adjustment of its status counters.
+        """
+        with transaction.atomic():
+            serializer.save()
+
     def get_object(self):
         """
         Returns the order object or raises 404 if not found.
@@ -186,6 +348,52 @@ class OrderRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         return [IsAuthenticated()]
 
 
+class OrderBulkStatusUpdateAPIView(generics.GenericAPIView):
+    """
+    Handles PATCH /orders/bulk-status/
+    Sets the status of several orders of the current business user at once.
+    """
+    serializer_class = OrderBulkStatusSerializer
+    permission_classes = [IsAuthenticated, IsBusinessUser]
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Checks that all ids belong to orders of the current business user with one query,
+        then updates the orders whose status differs with a single UPDATE and moves
+        them between the status counters.
+        Responds with 404 listing the ids that are not orders of the user.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids, new_status = serializer.validated_data['ids'], serializer.validated_data['status']
+        with transaction.atomic():
+            orders = Order.objects.select_for_update().filter(
+                id__in=ids, business_user=request.user)
+            current = dict(orders.values_list('id', 'status'))
+            missing = [order_id for order_id in ids if order_id not in current]
+            if missing:
+                return Response({"detail": "Orders not found.", "ids": missing},
+                                status=status.HTTP_404_NOT_FOUND)
+            changed = [order_id for order_id in ids if current[order_id] != new_status]
+            if changed:
+                self._update_status(request.user, changed, current, new_status)
+        return Response({"ids": ids, "status": new_status, "updated": len(changed)},
+                        status=status.HTTP_200_OK)
+
+    def _update_status(self, business_user, order_ids, current, new_status):
+        """
+        Updates status and `updated_at` of the orders and adjusts the counters.
+        """
+        Order.objects.filter(id__in=order_ids, business_user=business_user).update(
+            status=new_status, updated_at=timezone.now())
+        moved = {}
+        for order_id in order_ids:
+            moved[current[order_id]] = moved.get(current[order_id], 0) + 1
+        for old_status, count in moved.items():
+            BusinessOrderCounter.objects.adjust(business_user.pk, old_status, -count)
+        BusinessOrderCounter.objects.adjust(business_user.pk, new_status, len(order_ids))
+
+
 class OrderDeleteAPIView(generics.DestroyAPIView):
     """
     Handles DELETE /orders/{id}/
@@ -198,30 +406,25 @@ class OrderDeleteAPIView(generics.DestroyAPIView):
 ############### ORDER COUNT###############
 
 
-class OrderCountView(APIView):
+class OrderStatsView(APIView):
     """
-    Returns the count of in-progress orders for a specific business user.
+    Returns the number of orders per status for a specific business user.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, business_user_id):
         """
-        Returns the count of in-progress orders for a specific business user.
+        Returns the order statistics of a specific business user.
         Responds with 404 if the business user is not found.
         """
         try:
-            if not User.objects.filter(id=business_user_id, userprofile__type='business').exists():
+            stats = business_order_stats(business_user_id)
+            if stats is None:
                 return Response(
                     {"detail": "Business user not found."},
                     status=status.HTTP_404_NOT_FOUND
                 )
-
-            order_count = Order.objects.filter(
-                business_user_id=business_user_id,
-                status='in_progress'
-            ).count()
-
-            return Response({"order_count": order_count}, status=status.HTTP_200_OK)
+            return Response(self.format_stats(stats), status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -229,34 +432,24 @@ class OrderCountView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def format_stats(self, stats):
+        """Returns the response body for the statistics."""
+        return stats
+
 
-class CompletedOrderCountView(APIView):
+class OrderCountView(OrderStatsView):
     """
-    Returns the count of completed orders for a specific business user.
+    Returns the count of in-progress orders for a specific business user.
     """
-    permission_classes = [IsAuthenticated]
 
-    def get(self, request, business_user_id):
-        """
-        Returns the count of completed orders for a specific business user.
-        Responds with 404 if the business user is not found.
-        """
-        try:
-            if not User.objects.filter(id=business_user_id, userprofile__type='business').exists():
-                return Response(
-                    {"detail": "Business user not found."},
-                    status=status.HTTP_404_NOT_FOUND
-                )
+    def format_stats(self, stats):
+        return {"order_count": stats['in_progress']}
 
-            completed_order_count = Order.objects.filter(
-                business_user_id=business_user_id,
-                status='completed'
-            ).count()
 
-            return Response({"completed_order_count": completed_order_count}, status=status.HTTP_200_OK)
+class CompletedOrderCountView(OrderStatsView):
+    """
+    Returns the count of completed orders for a specific business user.
+    """
 
-        except Exception as e:
-            return Response(
-                {"detail": "An internal server error occurred."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+    def format_stats(self, stats):
+        return {"completed_order_count": stats['completed']}
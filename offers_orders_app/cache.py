@@ -0,0 +1,63 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import urlencode
+
+OFFERS_VERSION_KEY = 'offers:version'
+
+
+def get_offer_cache():
+    """Returns the cache backend configured for offer responses."""
+    return caches[getattr(settings, 'OFFER_CACHE_ALIAS', 'default')]
+
+
+def get_offers_version():
+    """
+    Returns the current global offers version.
+    The version is part of every cache key, so bumping it invalidates all cached offer responses.
+    """
+    cache = get_offer_cache()
+    version = cache.get(OFFERS_VERSION_KEY)
+    if version is None:
+        cache.add(OFFERS_VERSION_KEY, 1, timeout=None)
+        version = cache.get(OFFERS_VERSION_KEY, 1)
+    return version
+
+
+def bump_offers_version():
+    """Increments the global offers version."""
+    cache = get_offer_cache()
+    try:
+        cache.incr(OFFERS_VERSION_KEY)
+    except ValueError:
+        cache.add(OFFERS_VERSION_KEY, 1, timeout=None)
+
+
+def invalidate_offer_cache():
+    """
+    Invalidates cached offer responses after a write.
+    The version lives in the offer cache, so the invalidation only reaches other
+    worker processes if that cache is shared between them (e.g. Redis or Memcached).
+    Inside a transaction the version is bumped again on commit, so responses cached
+    from the old data while the transaction was open are not served afterwards.
+    """
+    bump_offers_version()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(bump_offers_version)
+
+
+def offer_cache_key(prefix, request):
+    """
+    Returns a cache key for the request based on the offers version, the URL
+    and the query parameters in normalized (sorted) order.
+    """
+    params = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+    )
+    normalized = f'{request.build_absolute_uri(request.path)}?{urlencode(params)}'
+    digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    return f'offers:{prefix}:{get_offers_version()}:{digest}'
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from offers_orders_app.models import Offer
+
+
+class Command(BaseCommand):
+    """
+    Recalculates the denormalized `min_price` and `min_delivery_time` columns of all offers.
+    `updated_at` is kept, the offers themselves did not change.
+    """
+    help = "Recalculates min_price and min_delivery_time for all offers from their details."
+
+    def handle(self, *args, **options):
+        updated = Offer.objects.all().update_min_values(touch=False)
+        self.stdout.write(self.style.SUCCESS(
+            f"Updated min values for {updated} offers."))
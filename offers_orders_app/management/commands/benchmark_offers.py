@@ -0,0 +1,167 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Min, Prefetch
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from offers_orders_app.api.filters import OfferFilter
+from offers_orders_app.api.serializers import (
+    OfferDetailHyperlinkedSerializer, OfferListSerializer, OfferListValuesSerializer)
+from offers_orders_app.models import Offer, OfferDetail
+from users_auth_app.models import UserProfile
+
+
+class Command(BaseCommand):
+    """
+    Benchmarks hot offer code paths against generated offers.
+    All generated rows are rolled back when the command finishes.
+    """
+    help = "Benchmarks offer code paths against generated data (rolled back afterwards)."
+
+    scenarios = ['filters', 'serialization', 'detail_urls', 'bulk_import']
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenario', choices=self.scenarios)
+        parser.add_argument('--offers', type=int, default=100000,
+                            help="Number of offers to generate.")
+        parser.add_argument('--repeat', type=int, default=5,
+                            help="Number of timed runs per case.")
+
+    def handle(self, *args, **options):
+        self.repeat = options['repeat']
+        with transaction.atomic():
+            user = User.objects.create_user(username='benchmark_offers_user')
+            self.stdout.write(f"Generating {options['offers']} offers ...")
+            self.generate_offers(user, options['offers'])
+            getattr(self, f"benchmark_{options['scenario']}")()
+            transaction.set_rollback(True)
+
+    def generate_offers(self, user, count, batch_size=5000):
+        """Bulk inserts offers with three details each and their stored minimum values."""
+        rng = random.Random(42)
+        for start in range(0, count, batch_size):
+            offers, packages = [], []
+            for index in range(start, min(start + batch_size, count)):
+                details = [
+                    (offer_type, rng.randint(10, 2000), rng.randint(1, 60))
+                    for offer_type in ('basic', 'standard', 'premium')
+                ]
+                offers.append(Offer(
+                    user=user, title=f"Offer {index}", description="Benchmark offer",
+                    min_price=min(price for _, price, _ in details),
+                    min_delivery_time=min(days for _, _, days in details),
+                ))
+                packages.append(details)
+            Offer.objects.bulk_create(offers)
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, title=offer_type, revisions=1,
+                            delivery_time_in_days=days, price=price,
+                            features=[], offer_type=offer_type)
+                for offer, details in zip(offers, packages)
+                for offer_type, price, days in details
+            ])
+
+    def measure(self, label, func):
+        """Runs `func` repeatedly and prints the median duration in milliseconds."""
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(
+            f"{label:<55} median {statistics.median(timings):9.2f} ms")
+
+    def benchmark_filters(self):
+        """Compares the filtered first list page against the former join-based filters."""
+        cases = [
+            {'min_price': 1500},
+            {'max_delivery_time': 5},
+            {'min_price': 1500, 'max_delivery_time': 5},
+        ]
+        for params in cases:
+            queryset = OfferFilter(
+                params, queryset=Offer.objects.order_by('min_price')).qs
+            self.measure(f"current {params}", lambda: self.first_page(queryset))
+            legacy = self.legacy_queryset(params)
+            self.measure(f"legacy join {params}", lambda: self.first_page(legacy))
+
+    def benchmark_serialization(self):
+        """Compares OfferListSerializer with the values() fast path for 1k and 10k rows."""
+        request = RequestFactory().get('/api/offers/', HTTP_HOST='127.0.0.1')
+        context = {'request': request}
+        queryset = Offer.objects.order_by('min_price')
+        for rows in (1000, 10000):
+            models_page = queryset.select_related('user').prefetch_related(Prefetch(
+                'details', queryset=OfferDetail.objects.only('id', 'offer_id').order_by('id')))
+            values_page = OfferListValuesSerializer.get_values_queryset(queryset)
+            self.measure(f"OfferListSerializer {rows} rows", lambda: OfferListSerializer(
+                models_page[:rows], many=True, context=context).data)
+            self.measure(f"OfferListValuesSerializer {rows} rows", lambda: OfferListValuesSerializer(
+                values_page[:rows], many=True, context=context).data)
+
+    def benchmark_detail_urls(self):
+        """Compares the precomputed detail URLs with a reverse() call per detail."""
+        details = list(OfferDetail.objects.only('id', 'offer_id'))
+        serializer = OfferDetailHyperlinkedSerializer()
+        self.measure(f"precomputed url, {len(details)} details",
+                     lambda: [serializer.get_url(detail) for detail in details])
+        self.measure(f"reverse() per detail, {len(details)} details", lambda: [
+            reverse('offer-details', kwargs={'pk': detail.pk}).replace('/api', '', 1)
+            for detail in details])
+        for rows in (1000, 10000):
+            page = Offer.objects.order_by('min_price').select_related('user').prefetch_related(
+                Prefetch('details', queryset=OfferDetail.objects.only('id', 'offer_id').order_by('id')))
+            self.measure(f"OfferListSerializer {rows} rows", lambda: OfferListSerializer(
+                page[:rows], many=True, context={'request': None}).data)
+
+    def benchmark_bulk_import(self, count=500, batch_size=100):
+        """Compares the offers/second of single POST requests with the bulk import."""
+        user = User.objects.create_user(username='benchmark_offers_business')
+        UserProfile.objects.create(user=user, type='business')
+        client = APIClient(HTTP_HOST='127.0.0.1')
+        client.force_authenticate(user)
+        payload = [{
+            'title': f"Import {index}", 'description': "Imported offer",
+            'details': [{'title': offer_type, 'revisions': 1, 'delivery_time_in_days': 5,
+                         'price': 100, 'features': [], 'offer_type': offer_type}
+                        for offer_type in ('basic', 'standard', 'premium')],
+        } for index in range(count)]
+
+        def post_single():
+            for offer in payload:
+                client.post(reverse('offer-list'), offer, format='json')
+
+        def post_bulk():
+            for start in range(0, count, batch_size):
+                client.post(reverse('offer-bulk-create'),
+                            payload[start:start + batch_size], format='json')
+
+        for label, func in [("single POST", post_single),
+                            (f"bulk POST ({batch_size} per request)", post_bulk)]:
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{label:<55} {count / elapsed:9.1f} offers/s")
+
+    def legacy_queryset(self, params):
+        """Builds the queryset as filtered before the EXISTS / stored column rewrite."""
+        queryset = Offer.objects.annotate(
+            legacy_min_price=Min('details__price')).order_by('legacy_min_price')
+        if 'min_price' in params:
+            queryset = queryset.filter(details__price__gte=params['min_price'])
+        if 'max_delivery_time' in params:
+            queryset = queryset.filter(
+                details__delivery_time_in_days__lte=params['max_delivery_time'])
+        return queryset
+
+    def first_page(self, queryset, page_size=6):
+        """Evaluates what a paginated list request needs: the count and the first page."""
+        queryset.count()
+        list(queryset[:page_size])
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from offers_orders_app.models import BusinessOrderCounter
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the per-business order counters from the orders and reports drift.
+    """
+    help = "Recomputes the order counters per business user and status and reports drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only report drift without correcting the counters.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drift = BusinessOrderCounter.objects.reconcile(dry_run=options['dry_run'])
+        for business_user_id, status, stored, actual in drift:
+            self.stdout.write(self.style.WARNING(
+                f"Business user {business_user_id} {status}: stored {stored}, actual {actual}"))
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("All order counters are correct."))
+        elif options['dry_run']:
+            self.stdout.write(f"{len(drift)} counters drifted, nothing changed (dry run).")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Corrected {len(drift)} counters."))
@@ -0,0 +1,46 @@
+from django.db import migrations
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE offers_orders_app_offer_fts USING fts5("
+    "title, description, tokenize = 'unicode61 remove_diacritics 2')",
+    "INSERT INTO offers_orders_app_offer_fts (rowid, title, description) "
+    "SELECT id, title, description FROM offers_orders_app_offer",
+]
+SQLITE_DROP = ["DROP TABLE IF EXISTS offers_orders_app_offer_fts"]
+
+POSTGRESQL_CREATE = [
+    'CREATE INDEX offer_search_gin_idx ON "offers_orders_app_offer" USING GIN ('
+    "to_tsvector('simple', coalesce(\"offers_orders_app_offer\".\"title\", '') || ' ' || "
+    "coalesce(\"offers_orders_app_offer\".\"description\", '')))",
+]
+POSTGRESQL_DROP = ["DROP INDEX IF EXISTS offer_search_gin_idx"]
+
+STATEMENTS = {
+    'sqlite': (SQLITE_CREATE, SQLITE_DROP),
+    'postgresql': (POSTGRESQL_CREATE, POSTGRESQL_DROP),
+}
+
+
+def run_statements(schema_editor, index):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    for statement in statements[index] if statements else []:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(schema_editor, 0)
+
+
+def drop_search_index(apps, schema_editor):
+    run_statements(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_orders_app', '0007_offer_min_delivery_time_offer_min_price_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
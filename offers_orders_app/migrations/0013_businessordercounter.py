@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 02:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_order_counters(apps, schema_editor):
+    Order = apps.get_model('offers_orders_app', 'Order')
+    BusinessOrderCounter = apps.get_model('offers_orders_app', 'BusinessOrderCounter')
+    rows = Order.objects.order_by().values('business_user_id', 'status').annotate(count=Count('id'))
+    BusinessOrderCounter.objects.bulk_create([
+        BusinessOrderCounter(business_user_id=row['business_user_id'],
+                             status=row['status'], count=row['count'])
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_orders_app', '0012_order_order_customer_created_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business_user', 'status'), name='unique_business_order_counter')],
+            },
+        ),
+        migrations.RunPython(backfill_order_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2 on 2026-10-18 02:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+OFFER_DETAIL_FIELDS = ['title', 'revisions', 'delivery_time_in_days',
+                       'price', 'features', 'offer_type']
+
+
+def copy_offer_detail_fields(apps, schema_editor):
+    Order = apps.get_model('offers_orders_app', 'Order')
+    OfferDetail = apps.get_model('offers_orders_app', 'OfferDetail')
+    details = OfferDetail.objects.filter(pk=OuterRef('offer_detail_id'))
+    Order.objects.update(**{
+        field: Subquery(details.values(field)[:1]) for field in OFFER_DETAIL_FIELDS
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_orders_app', '0013_businessordercounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='delivery_time_in_days',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='features',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='offer_type',
+            field=models.CharField(choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], default='basic', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='price',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='revisions',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='title',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.RunPython(copy_offer_detail_fields, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='order',
+            name='offer_detail',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='offers_orders_app.offerdetail'),
+        ),
+    ]
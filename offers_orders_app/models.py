@@ -1,9 +1,50 @@
 from django.db import models
+from django.db.models import Count, F, Min, OuterRef, Subquery
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 # Create your models here.
 
 
+class OfferQuerySet(models.QuerySet):
+    """QuerySet for offers with bulk maintenance and ordering helpers."""
+
+    def order_by_nulls_last(self, *terms):
+        """
+        Orders by field names (`-` prefix for descending) with NULLs last in both
+        directions, as the keyset pagination does, and `id` as tie-breaker in the
+        direction of the last term.
+        """
+        expressions, descending = [], False
+        for term in terms:
+            descending = term.startswith('-')
+            field = F(term.lstrip('-'))
+            expressions.append(field.desc(nulls_last=True) if descending
+                               else field.asc(nulls_last=True))
+        expressions.append(F('id').desc() if descending else F('id').asc())
+        return self.order_by(*expressions)
+
+    def update_min_values(self, touch=True):
+        """
+        Recalculates the denormalized `min_price` and `min_delivery_time` columns
+        from the offer details in a single UPDATE statement.
+        With `touch`, `updated_at` is bumped in the same statement so Last-Modified
+        follows changed details.
+        """
+        details = OfferDetail.objects.filter(
+            offer=OuterRef('pk')).order_by().values('offer')
+        updates = {}
+        if touch:
+            updates['updated_at'] = timezone.now()
+        return self.update(
+            min_price=Subquery(details.annotate(
+                value=Min('price')).values('value')),
+            min_delivery_time=Subquery(details.annotate(
+                value=Min('delivery_time_in_days')).values('value')),
+            **updates,
+        )
+
+
 class Offer(models.Model):
     """
     Represents a user-created offer containing multiple detailed packages.
@@ -14,13 +55,58 @@ class Offer(models.Model):
     title = models.CharField(max_length=255)
     image = models.ImageField(
         upload_to='offer_pictures/', null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now_add=True)
+    min_price = models.FloatField(null=True, blank=True, editable=False)
+    min_delivery_time = models.IntegerField(
+        null=True, blank=True, editable=False)
+
+    objects = OfferQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['min_price', 'id'],
+                         name='offer_min_price_idx'),
+            models.Index(fields=['min_delivery_time'],
+                         name='offer_min_delivery_time_idx'),
+            models.Index(fields=['updated_at', 'id'],
+                         name='offer_updated_at_idx'),
+            models.Index(fields=['user', 'min_price', 'id'],
+                         name='offer_user_min_price_idx'),
+        ]
+
+    MIN_VALUE_FIELDS = ['min_price', 'min_delivery_time']
 
     def __str__(self):
         return f"{self.title} ({self.user.username})"
 
+    def save(self, *args, **kwargs):
+        """
+        Leaves the stored minimum values out of full saves of existing offers, so an
+        instance loaded before its details changed does not overwrite them.
+        They are only written when listed in `update_fields`.
+        Every update of an existing offer also bumps `updated_at`.
+        """
+        if not self._state.adding:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                kwargs['update_fields'] = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name not in self.MIN_VALUE_FIELDS]
+            elif update_fields and 'updated_at' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'updated_at']
+            self.updated_at = timezone.now()
+        super().save(*args, **kwargs)
+
+    def update_min_values(self):
+        """
+        Recalculates the denormalized minimum price and delivery time from the offer details.
+        """
+        Offer.objects.filter(pk=self.pk).update_min_values()
+        self.refresh_from_db(fields=['min_price', 'min_delivery_time', 'updated_at'])
+
 
 class OfferDetail(models.Model):
     """Model for offer details."""
@@ -40,6 +126,12 @@ class OfferDetail(models.Model):
     features = models.JSONField()
     offer_type = models.CharField(max_length=50, choices=OFFER_TYPE_CHOICES)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['offer', 'price'],
+                         name='offerdetail_offer_price_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -48,7 +140,12 @@ class Order(models.Model):
     """
     Represents an order placed by a customer for a specific offer detail.
     Tracks the customer, business user, status, and timestamps.
+    The purchased package is copied from the offer detail when the order is created,
+    so later edits or the removal of the detail do not change the order.
     """
+    OFFER_DETAIL_FIELDS = ['title', 'revisions', 'delivery_time_in_days',
+                           'price', 'features', 'offer_type']
+
     STATUS_CHOICES = [
         ('in_progress', 'In Progress'),
         ('completed', 'Completed'),
@@ -60,11 +157,108 @@ class Order(models.Model):
     business_user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name='business_orders')
     offer_detail = models.ForeignKey(
-        OfferDetail, on_delete=models.CASCADE, related_name='orders')
+        OfferDetail, on_delete=models.SET_NULL, null=True, related_name='orders')
+    title = models.CharField(max_length=255, default='')
+    revisions = models.IntegerField(default=0)
+    delivery_time_in_days = models.IntegerField(default=0)
+    price = models.FloatField(default=0)
+    features = models.JSONField(default=list)
+    offer_type = models.CharField(
+        max_length=50, choices=OfferDetail.OFFER_TYPE_CHOICES, default='basic')
     status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default='in_progress')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'status'],
+                         name='order_business_status_idx'),
+            models.Index(fields=['customer_user', 'created_at', 'id'],
+                         name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at', 'id'],
+                         name='order_business_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Order {self.id} - {self.title} ({self.status})"
+
+    def save(self, *args, **kwargs):
+        """
+        Copies the package fields from the offer detail when the order is created.
+        """
+        if self._state.adding and self.offer_detail is not None:
+            self.copy_offer_detail(self.offer_detail)
+        super().save(*args, **kwargs)
+
+    def copy_offer_detail(self, offer_detail):
+        """Sets the package fields of the order to the values of `offer_detail`."""
+        for field in self.OFFER_DETAIL_FIELDS:
+            setattr(self, field, getattr(offer_detail, field))
+
+
+class BusinessOrderCounterQuerySet(models.QuerySet):
+    """QuerySet for order counters with maintenance helpers."""
+
+    def adjust(self, business_user_id, status, delta):
+        """
+        Adds `delta` to the counter of a business user and status with a single
+        `F()` UPDATE, creating the counter on the first positive adjustment.
+        """
+        counters = self.filter(business_user_id=business_user_id, status=status)
+        if counters.update(count=F('count') + delta) or delta <= 0:
+            return
+        _, created = self.get_or_create(
+            business_user_id=business_user_id, status=status, defaults={'count': delta})
+        if not created:
+            counters.update(count=F('count') + delta)
+
+    def reconcile(self, dry_run=False):
+        """
+        Recomputes all counters from the orders and returns the drifted ones as
+        `(business_user_id, status, stored, actual)` tuples.
+        With `dry_run` the drift is only reported.
+        """
+        actual = {
+            (row['business_user_id'], row['status']): row['count']
+            for row in Order.objects.order_by().values(
+                'business_user_id', 'status').annotate(count=Count('id'))
+        }
+        stored = {(counter.business_user_id, counter.status): counter
+                  for counter in self.all()}
+        drift, changed, missing = [], [], []
+        for key in stored.keys() | actual.keys():
+            counter, count = stored.get(key), actual.get(key, 0)
+            if counter is None:
+                missing.append(self.model(business_user_id=key[0], status=key[1], count=count))
+                drift.append((*key, 0, count))
+            elif counter.count != count:
+                drift.append((*key, counter.count, count))
+                counter.count = count
+                changed.append(counter)
+        if not dry_run:
+            self.bulk_create(missing)
+            self.bulk_update(changed, ['count'])
+        return sorted(drift)
+
+
+class BusinessOrderCounter(models.Model):
+    """
+    Number of orders per business user and status, maintained by the order signals
+    so order statistics are read without counting the order history.
+    """
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='order_counters')
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    objects = BusinessOrderCounterQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['business_user', 'status'],
+                                    name='unique_business_order_counter'),
+        ]
+
     def __str__(self):
-        return f"Order {self.id} - {self.offer_detail.title} ({self.status})"
+        return f"{self.business_user_id} {self.status}: {self.count}"
@@ -0,0 +1,116 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+from .models import Offer
+
+OFFER_TABLE = Offer._meta.db_table
+FTS_TABLE = f'{OFFER_TABLE}_fts'
+PG_DOCUMENT = (
+    "to_tsvector('simple', coalesce(\"{table}\".\"title\", '') || ' ' || "
+    "coalesce(\"{table}\".\"description\", ''))"
+).format(table=OFFER_TABLE)
+
+
+def split_words(terms):
+    """
+    Splits search terms into plain words, dropping punctuation and query syntax.
+    The backends only receive words produced by this function.
+    """
+    return [word for term in terms for word in re.findall(r'\w+', term)]
+
+
+class SQLiteOfferSearch:
+    """
+    Full-text search over an FTS5 table that mirrors offer titles and descriptions.
+    The table is kept in sync by the offer signals.
+    """
+    rank_ordering = 'search_rank'
+
+    def index_offer(self, offer):
+        """Replaces the indexed title and description of an offer."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [offer.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) VALUES (%s, %s, %s)",
+                [offer.pk, offer.title, offer.description]
+            )
+
+    def index_offers(self, offers):
+        """Adds newly created offers to the index with one statement."""
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) VALUES (%s, %s, %s)",
+                [[offer.pk, offer.title, offer.description] for offer in offers]
+            )
+
+    def remove_offer(self, offer_id):
+        """Removes an offer from the index."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [offer_id])
+
+    def build_query(self, words):
+        """
+        Builds an FTS5 query matching every word as a prefix.
+        Words are quoted so keywords like NOT are matched literally.
+        """
+        return ' '.join(f'"{word}"*' for word in words)
+
+    def search(self, queryset, words):
+        """Restricts the queryset to matching offers and adds the bm25 rank (lower is better) as `search_rank`."""
+        query = self.build_query(words)
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [query]),
+        ).alias(search_rank=RawSQL(
+            f'SELECT bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = "{OFFER_TABLE}"."id"',
+            [query], output_field=FloatField()))
+
+
+class PostgreSQLOfferSearch:
+    """
+    Full-text search backed by a GIN expression index on the offer `tsvector`.
+    PostgreSQL maintains the index itself, so no signal updates are needed.
+    """
+    rank_ordering = '-search_rank'
+
+    def index_offer(self, offer):
+        """Nothing to do, the expression index is updated with the row."""
+
+    def index_offers(self, offers):
+        """Nothing to do, the expression index is updated with the rows."""
+
+    def remove_offer(self, offer_id):
+        """Nothing to do, the expression index is updated with the row."""
+
+    def build_query(self, words):
+        """Builds a tsquery matching every word as a prefix."""
+        return ' & '.join(f'{word}:*' for word in words)
+
+    def search(self, queryset, words):
+        """Restricts the queryset to matching offers and adds the ts_rank (higher is better) as `search_rank`."""
+        query = self.build_query(words)
+        return queryset.filter(RawSQL(
+            f"{PG_DOCUMENT} @@ to_tsquery('simple', %s)", [query], output_field=BooleanField(),
+        )).alias(search_rank=RawSQL(
+            f"ts_rank({PG_DOCUMENT}, to_tsquery('simple', %s))", [query],
+            output_field=FloatField()))
+
+
+BACKENDS = {
+    'sqlite': SQLiteOfferSearch,
+    'postgresql': PostgreSQLOfferSearch,
+}
+
+
+def get_search_backend(vendor=None):
+    """
+    Returns the full-text search backend for the database vendor,
+    or None if the database has no supported full-text index.
+    """
+    backend_class = BACKENDS.get(vendor or connection.vendor)
+    return backend_class() if backend_class else None
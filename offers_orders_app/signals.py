@@ -0,0 +1,125 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from utils.image_utils import schedule_image_variants
+from .cache import invalidate_offer_cache
+from .models import BusinessOrderCounter, Offer, OfferDetail, Order
+from .search import get_search_backend
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def update_offer_min_values(sender, instance, origin=None, **kwargs):
+    """
+    Keeps the denormalized minimum price and delivery time of the offer in sync
+    whenever one of its details is saved or deleted.
+    Skipped when the details are deleted together with their offer.
+    """
+    if isinstance(origin, Offer):
+        return
+    Offer.objects.filter(pk=instance.offer_id).update_min_values()
+
+
+@receiver(post_save, sender=Offer)
+def index_offer(sender, instance, update_fields=None, **kwargs):
+    """
+    Updates the full-text index when the title or description of an offer may have changed.
+    """
+    if update_fields is not None and not {'title', 'description'} & set(update_fields):
+        return
+    backend = get_search_backend()
+    if backend is not None:
+        backend.index_offer(instance)
+
+
+@receiver(post_save, sender=Offer)
+def generate_offer_image_variants(sender, instance, update_fields=None, **kwargs):
+    """
+    Renders thumbnails and WebP variants of a newly uploaded offer image in the background.
+    Cached listings are invalidated once the variants are stored.
+    """
+    if update_fields is not None and 'image' not in update_fields:
+        return
+    schedule_image_variants(instance, 'image', 'image_variants',
+                            on_stored=invalidate_offer_cache)
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index(sender, instance, **kwargs):
+    """
+    Removes a deleted offer from the full-text index.
+    """
+    backend = get_search_backend()
+    if backend is not None:
+        backend.remove_offer(instance.pk)
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_responses(sender, **kwargs):
+    """
+    Invalidates cached offer listings whenever an offer or offer detail changes.
+    """
+    invalidate_offer_cache()
+
+
+OFFER_USER_FIELDS = {'username', 'first_name', 'last_name'}
+
+
+@receiver(post_save, sender=User)
+def invalidate_offer_user_details(sender, update_fields=None, **kwargs):
+    """
+    Invalidates cached offer listings when a user may have changed the names
+    shown in `user_details`.
+    """
+    if update_fields is not None and not OFFER_USER_FIELDS & set(update_fields):
+        return
+    invalidate_offer_cache()
+
+
+def _order_counter_key(order):
+    """
+    Returns the `(business_user_id, status)` counter of an order, or None if one
+    of the columns was not loaded.
+    """
+    values = order.__dict__
+    if 'business_user_id' not in values or 'status' not in values:
+        return None
+    return values['business_user_id'], values['status']
+
+
+@receiver(post_init, sender=Order)
+def remember_order_counter_key(sender, instance, **kwargs):
+    """
+    Remembers the counter an order was loaded with, so saves can move it to another counter.
+    """
+    instance._counter_key = _order_counter_key(instance)
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Counts a new order and moves a changed order from its previous counter to the current one.
+    """
+    if update_fields is not None and 'status' not in update_fields:
+        return
+    previous, current = instance._counter_key, _order_counter_key(instance)
+    if created:
+        BusinessOrderCounter.objects.adjust(*current, 1)
+    elif previous is not None and current is not None and previous != current:
+        BusinessOrderCounter.objects.adjust(*previous, -1)
+        BusinessOrderCounter.objects.adjust(*current, 1)
+    instance._counter_key = current
+
+
+@receiver(post_delete, sender=Order)
+def uncount_deleted_order(sender, instance, **kwargs):
+    """
+    Removes a deleted order from its counter.
+    """
+    key = instance._counter_key or _order_counter_key(instance)
+    if key is not None:
+        BusinessOrderCounter.objects.adjust(*key, -1)
@@ -0,0 +1,87 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Offer, OfferDetail
+from utils.test_utils import TestHelper
+
+
+class OfferBulkCreateTests(APITestCase):
+    """
+    Tests for the bulk offer import POST /offers/bulk/.
+    """
+
+    def setUp(self):
+        """
+        Authenticates a business user.
+        """
+        self.url = reverse('offer-bulk-create')
+        self.user = TestHelper.create_user(is_business=True)
+        self.token = TestHelper.create_token(self.user)
+        TestHelper.auth_client(self.client, self.token)
+
+    def _offer(self, title, base_price=100):
+        """Returns an offer in the creation format with three details."""
+        return {
+            "title": title,
+            "description": f"Beschreibung {title}",
+            "details": [
+                {"title": f"{offer_type} {title}", "revisions": 2,
+                 "delivery_time_in_days": days, "price": base_price * factor,
+                 "features": ["Logo"], "offer_type": offer_type}
+                for offer_type, days, factor in [
+                    ("basic", 7, 1), ("standard", 5, 2), ("premium", 3, 3)]
+            ],
+        }
+
+    def test_bulk_create_inserts_offers_and_details_in_batches(self):
+        """Tests that all offers are created with two INSERTs and correct minimum values."""
+        payload = [self._offer(f"Offer {index}", 100 + index) for index in range(5)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len(response.data[0]['details']), 3)
+        inserts = [query['sql'] for query in queries.captured_queries
+                   if query['sql'].startswith('INSERT INTO "offers_orders_app_offer')]
+        self.assertEqual(len(inserts), 2)
+        offer = Offer.objects.get(pk=response.data[2]['id'])
+        self.assertEqual(offer.user, self.user)
+        self.assertEqual(offer.min_price, 102)
+        self.assertEqual(offer.min_delivery_time, 3)
+        self.assertEqual(OfferDetail.objects.count(), 15)
+
+    def test_bulk_created_offers_are_listed_and_searchable(self):
+        """Tests that the offer cache and the search index include the new offers."""
+        self.client.get(reverse('offer-list'))
+        self.client.post(self.url, data=[self._offer("Logodesign")], format='json')
+        response = self.client.get(reverse('offer-list'), {'search': 'logodes'})
+        self.assertEqual(response.data['count'], 1)
+
+    def test_invalid_item_reports_errors_per_index_and_creates_nothing(self):
+        """Tests that a single invalid offer rejects the whole import."""
+        invalid = self._offer("Invalid")
+        invalid['details'] = invalid['details'][:2]
+        payload = [self._offer("Valid"), invalid]
+        response = self.client.post(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('details', response.data[1])
+        self.assertFalse(Offer.objects.exists())
+
+    def test_empty_or_too_large_import_returns_400(self):
+        """Tests the lower and upper limit of offers per request."""
+        response = self.client.post(self.url, data=[], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        payload = [self._offer(f"Offer {index}") for index in range(101)]
+        response = self.client.post(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_customer_user_gets_403(self):
+        """Tests that only business users can import offers."""
+        customer = TestHelper.create_user(username='customer')
+        TestHelper.auth_client(self.client, TestHelper.create_token(customer))
+        response = self.client.post(self.url, data=[self._offer("Offer")], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,78 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.cache import get_offer_cache, get_offers_version, invalidate_offer_cache
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferListCacheTests(APITestCase):
+    """
+    Tests for the versioned response cache of GET /offers/.
+    """
+
+    def setUp(self):
+        """
+        Clears the cache and creates an offer with details.
+        """
+        get_offer_cache().clear()
+        self.url = reverse('offer-list')
+        self.user = TestHelper.create_user(is_business=True)
+        self.offer = OfferTestHelper.create_offer(self.user)
+        self.details = OfferTestHelper.create_offer_details(self.offer)
+
+    def test_repeated_listing_is_served_from_cache(self):
+        """Tests that an identical listing with reordered parameters runs no queries."""
+        first = self.client.get(self.url, {'page': 1, 'ordering': 'min_price'})
+        with self.assertNumQueries(0):
+            second = self.client.get(
+                self.url, {'ordering': 'min_price', 'page': 1})
+        self.assertEqual(first.json(), second.json())
+
+    def test_different_parameters_are_cached_separately(self):
+        """Tests that filters are part of the cache key."""
+        self.client.get(self.url)
+        response = self.client.get(self.url, {'max_delivery_time': 1})
+        self.assertEqual(response.data["count"], 0)
+
+    def test_offer_update_invalidates_cache(self):
+        """Tests that saving an offer is visible in the next listing."""
+        self.client.get(self.url)
+        self.offer.title = "Neuer Titel"
+        self.offer.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["results"][0]["title"], "Neuer Titel")
+
+    def test_detail_delete_invalidates_cache(self):
+        """Tests that deleting an offer detail is visible in the next listing."""
+        self.client.get(self.url)
+        self.details[0].delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["results"][0]["min_price"], 120.0)
+        self.assertEqual(len(response.data["results"][0]["details"]), 2)
+
+    def test_user_name_change_invalidates_cache(self):
+        """Tests that changing the owner's name via the profile is visible in the next listing."""
+        self.client.get(self.url)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+        response = self.client.patch(
+            reverse('profile-detail', kwargs={'pk': self.user.pk}),
+            {"first_name": "Anna"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["results"][0]["user_details"]["first_name"], "Anna")
+
+    def test_last_login_update_keeps_cache(self):
+        """Tests that saving unrelated user fields does not invalidate the listing."""
+        version = get_offers_version()
+        self.user.save(update_fields=['last_login'])
+        self.assertEqual(get_offers_version(), version)
+
+    def test_version_bumped_again_on_commit(self):
+        """Tests that writes inside a transaction bump the version again after commit."""
+        version = get_offers_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_offer_cache()
+            self.assertEqual(get_offers_version(), version + 1)
+        self.assertEqual(get_offers_version(), version + 2)
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Offer
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferConditionalGetTests(APITestCase):
+    """
+    Tests for ETag and Last-Modified handling on single offers and offer details.
+    """
+
+    def setUp(self):
+        """
+        Authenticates a business user and creates an offer with details.
+        """
+        self.user = TestHelper.create_user(is_business=True)
+        self.token = TestHelper.create_token(self.user)
+        TestHelper.auth_client(self.client, self.token)
+        self.offer = OfferTestHelper.create_offer(self.user)
+        self.details = OfferTestHelper.create_offer_details(self.offer)
+        self.url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        self.detail_url = reverse(
+            'offer-details', kwargs={'pk': self.details[0].pk})
+
+    def test_offer_response_has_validators(self):
+        """Tests that a single offer carries ETag and Last-Modified headers."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_offer_if_none_match_returns_304(self):
+        """Tests that a matching ETag returns 304 without a body."""
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_offer_if_modified_since_returns_304(self):
+        """Tests that an unchanged offer returns 304 for If-Modified-Since."""
+        last_modified = self.client.get(self.url)['Last-Modified']
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_offer_change_invalidates_etag(self):
+        """Tests that editing a detail of the offer changes its ETag."""
+        etag = self.client.get(self.url)['ETag']
+        self.client.patch(self.url, data={"details": [
+            {"price": 10, "offer_type": "basic"}]}, format='json')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["min_price"], 10.0)
+
+    def test_offer_stale_if_modified_since_returns_200(self):
+        """Tests that a date before the last change returns the full offer."""
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=http_date(0))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_offer_save_invalidates_validators(self):
+        """Tests that saving the offer outside the API bumps `updated_at` and the ETag."""
+        response = self.client.get(self.url)
+        updated_at = self.offer.updated_at
+        self.offer.title = "Neuer Titel"
+        self.offer.save(update_fields=['title'])
+        self.offer.refresh_from_db()
+        self.assertGreater(self.offer.updated_at, updated_at)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Neuer Titel")
+
+    def test_offer_queryset_update_invalidates_etag(self):
+        """Tests that a rendered column written without `updated_at` still changes the ETag."""
+        etag = self.client.get(self.url)['ETag']
+        Offer.objects.filter(pk=self.offer.pk).update(description="Neu")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["description"], "Neu")
+
+    def test_detail_save_invalidates_last_modified(self):
+        """Tests that saving a detail outside the offer PATCH is visible via If-Modified-Since."""
+        Offer.objects.filter(pk=self.offer.pk).update(
+            updated_at=timezone.now() - timedelta(hours=1))
+        last_modified = self.client.get(self.url)['Last-Modified']
+        self.details[0].price = 1
+        self.details[0].save()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["min_price"], 1.0)
+
+    def test_offer_detail_if_none_match_returns_304(self):
+        """Tests conditional GET on an offer detail."""
+        etag = self.client.get(self.detail_url)['ETag']
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.details[0].price = 99
+        self.details[0].save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_conditional_get_still_requires_authentication(self):
+        """Tests that a matching ETag does not bypass authentication."""
+        etag = self.client.get(self.url)['ETag']
+        self.client.credentials()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Offer, OfferDetail
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferCursorPaginationTests(APITestCase):
+    """
+    Tests for GET /offers/?pagination=cursor keyset pagination.
+    """
+
+    def setUp(self):
+        """
+        Creates offers with duplicate prices, one offer without details and distinct update times.
+        """
+        self.url = reverse('offer-list')
+        self.user = TestHelper.create_user(is_business=True)
+        now = timezone.now()
+        prices = [300, 100, 200, 100, 50]
+        self.offers = []
+        for index, price in enumerate(prices):
+            offer = OfferTestHelper.create_offer(self.user, title=f"Offer {index}")
+            OfferDetail.objects.create(
+                offer=offer, title="Basic", revisions=1, delivery_time_in_days=3,
+                price=price, features=[], offer_type="basic")
+            self.offers.append(offer)
+        self.offers.append(OfferTestHelper.create_offer(self.user, title="Empty"))
+        for index, offer in enumerate(self.offers):
+            Offer.objects.filter(pk=offer.pk).update(
+                updated_at=now - timedelta(days=index))
+
+    def _collect_pages(self, params):
+        """Follows next links and returns the result ids of every page."""
+        pages = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([offer["id"] for offer in response.data["results"]])
+            if response.data["next"] is None:
+                return pages, response
+            response = self.client.get(response.data["next"])
+
+    def test_pages_follow_min_price_then_id(self):
+        """Tests that pages are ordered by min_price and id with offers without price last."""
+        pages, _ = self._collect_pages({'pagination': 'cursor', 'page_size': 2})
+        ids = [offer_id for page in pages for offer_id in page]
+        expected = [self.offers[i].id for i in (4, 1, 3, 2, 0, 5)]
+        self.assertEqual(ids, expected)
+        self.assertEqual([len(page) for page in pages], [2, 2, 2])
+
+    def test_descending_updated_at(self):
+        """Tests keyset paging on -updated_at."""
+        pages, _ = self._collect_pages(
+            {'pagination': 'cursor', 'page_size': 4, 'ordering': '-updated_at'})
+        ids = [offer_id for page in pages for offer_id in page]
+        self.assertEqual(ids, [offer.id for offer in self.offers])
+
+    def test_previous_link_returns_prior_page(self):
+        """Tests that following previous from the last page returns the page before it."""
+        pages, last = self._collect_pages({'pagination': 'cursor', 'page_size': 2})
+        response = self.client.get(last.data["previous"])
+        self.assertEqual(
+            [offer["id"] for offer in response.data["results"]], pages[-2])
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(
+            [offer["id"] for offer in response.data["results"]], pages[0])
+        self.assertIsNone(response.data["previous"])
+
+    def test_no_count_query(self):
+        """Tests that a cursor page runs no COUNT query and returns no count."""
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertNotIn("count", response.data)
+        self.assertIn("next", response.data)
+
+    def test_invalid_cursor_returns_404(self):
+        """Tests that a malformed cursor is rejected."""
+        response = self.client.get(
+            self.url, {'pagination': 'cursor', 'cursor': 'garbage'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_from_other_ordering_is_rejected(self):
+        """Tests that a cursor cannot be reused with a different ordering."""
+        response = self.client.get(
+            self.url, {'pagination': 'cursor', 'page_size': 2})
+        cursor = response.data["next"].split('cursor=')[1].split('&')[0]
+        response = self.client.get(self.url, {
+            'pagination': 'cursor', 'ordering': 'updated_at', 'cursor': cursor})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_uses_same_order(self):
+        """Tests that both pagination modes order offers alike, offers without details last."""
+        for ordering in [None, 'min_price', '-min_price']:
+            params = {'page_size': 100}
+            if ordering:
+                params['ordering'] = ordering
+            response = self.client.get(self.url, params)
+            page_ids = [offer["id"] for offer in response.data["results"]]
+            pages, _ = self._collect_pages({**params, 'pagination': 'cursor', 'page_size': 2})
+            self.assertEqual(page_ids, [offer_id for page in pages for offer_id in page])
+            self.assertEqual(page_ids[-1], self.offers[5].id)
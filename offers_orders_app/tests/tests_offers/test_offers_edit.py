@@ -1,7 +1,10 @@
 from users_auth_app.models import User, UserProfile
 from .test_offers_helpers import OfferTestHelper
 from utils.test_utils import TestHelper
-from ...models import Offer
+from unittest import mock
+from ...models import Offer, OfferDetail
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
@@ -62,6 +65,27 @@ class OfferCreateTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_create_offer_inserts_details_with_one_query(self):
+        """Test that all details are inserted at once and the minimum values are stored."""
+        payload = self._valid_payload()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        detail_inserts = [query for query in queries.captured_queries
+                          if query['sql'].startswith('INSERT INTO "offers_orders_app_offerdetail"')]
+        self.assertEqual(len(detail_inserts), 1)
+        offer = Offer.objects.get(pk=response.data['id'])
+        self.assertEqual(offer.min_price, 100)
+        self.assertEqual(offer.min_delivery_time, 5)
+
+    def test_create_offer_is_rolled_back_if_details_fail(self):
+        """Test that no offer is left behind when inserting the details fails."""
+        payload = self._valid_payload()
+        with mock.patch.object(OfferDetail.objects, 'bulk_create', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.client.post(self.url, data=payload, format='json')
+        self.assertFalse(Offer.objects.exists())
+
     def _valid_payload(self):
         """Returns a valid payload with exactly 3 offer details."""
         return {
@@ -162,6 +186,29 @@ class OfferPatchTests(APITestCase):
         response = self.client.patch(self.url, data=payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_patch_writes_only_changed_detail_columns(self):
+        """
+        Tests that changed details are written with one UPDATE of the changed columns
+        and that the stored minimum price follows the new price.
+        """
+        payload = {"details": [
+            {"price": 80, "offer_type": "basic"},
+            {"price": 90, "revisions": 5, "offer_type": "standard"},
+            {"price": 150, "offer_type": "premium"},
+        ]}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        detail_updates = [query['sql'] for query in queries.captured_queries
+                          if query['sql'].startswith('UPDATE "offers_orders_app_offerdetail"')]
+        self.assertEqual(len(detail_updates), 1)
+        self.assertIn('"price"', detail_updates[0])
+        self.assertNotIn('"title"', detail_updates[0])
+        self.assertNotIn('"revisions"', detail_updates[0])
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 80)
+        self.assertEqual(self.offer.details.get(offer_type='standard').price, 90)
+
     def test_offer_type_cannot_be_changed(self):
         """
         Ensures that changing 'offer_type' in an existing detail returns 400.
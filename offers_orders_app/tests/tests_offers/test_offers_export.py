@@ -0,0 +1,59 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferExportTests(APITestCase):
+    """
+    Tests for the streaming NDJSON export GET /offers/export/.
+    """
+
+    def setUp(self):
+        """
+        Authenticates a user and creates offers with details.
+        """
+        self.url = reverse('offer-export')
+        self.user = TestHelper.create_user(is_business=True)
+        self.token = TestHelper.create_token(self.user)
+        TestHelper.auth_client(self.client, self.token)
+        self.offers = []
+        for index in range(3):
+            offer = OfferTestHelper.create_offer(self.user, title=f"Offer {index}")
+            OfferTestHelper.create_offer_details(offer)
+            self.offers.append(offer)
+
+    def _read_lines(self, response):
+        """Consumes the streamed body and parses one JSON object per line."""
+        body = b''.join(response.streaming_content).decode('utf-8')
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_export_streams_one_offer_per_line(self):
+        """Tests that every offer is exported with details and minimum values."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        offers = self._read_lines(response)
+        self.assertEqual([offer["id"] for offer in offers],
+                         [offer.id for offer in self.offers])
+        self.assertEqual(offers[0]["min_price"], 100.0)
+        self.assertEqual(offers[0]["min_delivery_time"], 5)
+        self.assertEqual(len(offers[0]["details"]), 3)
+        self.assertEqual(offers[0]["details"][0]["offer_type"], "basic")
+
+    def test_export_query_count_is_constant(self):
+        """Tests that the export reads offers and details in chunks."""
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+            self._read_lines(response)
+
+    def test_export_requires_authentication(self):
+        """Tests that anonymous users cannot export the catalogue."""
+        self.client.credentials()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,64 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import OfferDetail
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferFacetsTests(APITestCase):
+    """
+    Tests for the price and delivery time facets GET /offers/facets/.
+    """
+
+    def setUp(self):
+        """
+        Creates offers with one detail each and one offer without details.
+        """
+        self.url = reverse('offer-facets')
+        self.user = TestHelper.create_user(is_business=True)
+        self.other_user = TestHelper.create_user(username='anna', is_business=True)
+        for title, price, days, user in [
+            ("Logo", 40, 1, self.user),
+            ("Logo Premium", 80, 3, self.user),
+            ("Website", 80, 10, self.user),
+            ("Shop", 1500, 40, self.other_user),
+        ]:
+            offer = OfferTestHelper.create_offer(user, title=title)
+            OfferDetail.objects.create(
+                offer=offer, title=title, revisions=1, delivery_time_in_days=days,
+                price=price, features=[], offer_type='basic')
+        OfferTestHelper.create_offer(self.user, title="Ohne Details")
+
+    def _counts(self, buckets):
+        return [bucket['count'] for bucket in buckets]
+
+    def test_facets_count_all_offers_with_one_query(self):
+        """Tests the bucket boundaries and counts over the whole catalogue."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(response.data['price'][0], {'from': None, 'to': 50, 'count': 1})
+        self.assertEqual(response.data['price'][-1], {'from': 1000, 'to': None, 'count': 1})
+        self.assertEqual(self._counts(response.data['price']), [1, 2, 0, 0, 0, 1])
+        self.assertEqual(self._counts(response.data['delivery_time']), [1, 1, 0, 1, 0, 1])
+
+    def test_facets_respect_filters_and_search(self):
+        """Tests that the counts only include offers matching filters and search."""
+        response = self.client.get(self.url, {'creator_id': self.user.id, 'search': 'logo'})
+        self.assertEqual(self._counts(response.data['price']), [1, 1, 0, 0, 0, 0])
+        response = self.client.get(self.url, {'max_delivery_time': 5, 'ordering': '-updated_at'})
+        self.assertEqual(self._counts(response.data['delivery_time']), [1, 1, 0, 0, 0, 0])
+
+    def test_facets_are_cached_until_offers_change(self):
+        """Tests that repeated requests are served from the cache and invalidated by writes."""
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+        OfferDetail.objects.filter(price=1500).first().delete()
+        response = self.client.get(self.url)
+        self.assertEqual(self._counts(response.data['price']), [1, 2, 0, 0, 0, 0])
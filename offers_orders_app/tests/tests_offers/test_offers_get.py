@@ -75,6 +75,18 @@ class OfferGetViewTests(APITestCase):
         response = self.client.get(self.url, {'min_price': 0})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_filter_min_price_returns_each_offer_once(self):
+        """
+        Tests that an offer with several matching details is listed once with its real minimum.
+        """
+        response = self.client.get(self.url, {'min_price': 50})
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["min_price"], 100.0)
+        response = self.client.get(self.url, {'min_price': 150})
+        self.assertEqual(response.data["count"], 1)
+        response = self.client.get(self.url, {'min_price': 250})
+        self.assertEqual(response.data["count"], 0)
+
     def test_filter_by_max_delivery_time(self):
         """
         Tests filtering offers by max_delivery_time query parameter.
@@ -129,6 +141,27 @@ class OfferGetViewTests(APITestCase):
         response = self.client.get(detail_url)
         OfferTestHelper.check_single_offer_data_types(self, response.data)
 
+    def test_list_query_count_is_constant(self):
+        """
+        Tests that listing offers costs the same number of queries regardless of the page size.
+        """
+        for i in range(5):
+            offer = OfferTestHelper.create_offer(self.user, title=f"Offer {i}")
+            OfferTestHelper.create_offer_details(offer)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {'page_size': 10})
+        self.assertEqual(len(response.data["results"]), 6)
+
+    def test_list_returns_min_values(self):
+        """
+        Tests that the annotated minimum price and delivery time are returned.
+        """
+        response = self.client.get(self.url)
+        offer = response.data["results"][0]
+        self.assertEqual(offer["min_price"], 100.0)
+        self.assertEqual(offer["min_delivery_time"], 7)
+        self.assertEqual(offer["user_details"]["username"], "john")
+
     def test_get_single_offer_unauthenticated(self):
         """
         Tests that retrieving a single offer without authentication returns 401.
@@ -0,0 +1,111 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Offer
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_VARIANTS_SYNC=True, IMAGE_VARIANT_WIDTHS=[320, 640])
+class OfferImageVariantsTests(APITestCase):
+    """
+    Tests the thumbnails and WebP variants rendered after an offer image upload.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """
+        Authenticates the owner of an offer.
+        """
+        self.user = TestHelper.create_user(is_business=True)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+        self.offer = OfferTestHelper.create_offer(self.user)
+        OfferTestHelper.create_offer_details(self.offer)
+        self.url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+
+    def _upload(self, upload):
+        """Stores an offer image and runs the variant rendering scheduled on commit."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer.image = upload
+            self.offer.save()
+        self.offer.refresh_from_db()
+
+    def _open(self, name):
+        with default_storage.open(name) as file:
+            image = Image.open(file)
+            image.load()
+        return image
+
+    def test_upload_renders_thumbnails_and_webp_variants(self):
+        """Tests that every width gets a thumbnail and a WebP file of the right size."""
+        self._upload(TestHelper.create_image_upload())
+        files = self.offer.image_variants['files']
+        self.assertEqual(set(files), {'320w', '320w_webp', '640w', '640w_webp'})
+        self.assertEqual(self._open(files['320w']).size, (320, 160))
+        self.assertEqual(self._open(files['640w_webp']).format, 'WEBP')
+        self.assertEqual(self.offer.image_variants['source'], self.offer.image.name)
+
+    def test_small_images_are_not_upscaled(self):
+        """Tests that variants are never larger than the original."""
+        self._upload(TestHelper.create_image_upload(size=(200, 100)))
+        files = self.offer.image_variants['files']
+        self.assertEqual(self._open(files['640w']).size, (200, 100))
+
+    def test_replacing_the_image_deletes_old_variants(self):
+        """Tests that the variants of a replaced image are removed from the storage."""
+        self._upload(TestHelper.create_image_upload('erstes.png'))
+        old_files = self.offer.image_variants['files'].values()
+        self._upload(TestHelper.create_image_upload('zweites.png'))
+        self.assertTrue(all(not default_storage.exists(name) for name in old_files))
+        self.assertIn('zweites', self.offer.image_variants['files']['320w'])
+
+    def test_list_shows_variants_once_rendered(self):
+        """Tests that the cached offer list is invalidated when the variants are stored."""
+        list_url = reverse('offer-list')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer.image = TestHelper.create_image_upload()
+            self.offer.save()
+            response = self.client.get(list_url)
+            self.assertEqual(response.data['results'][0]['image_variants'], {})
+        response = self.client.get(list_url)
+        variants = response.data['results'][0]['image_variants']
+        self.assertTrue(variants['320w_webp'].startswith('http://testserver/media/'))
+        self.assertTrue(variants['320w_webp'].endswith('_320w.webp'))
+
+    def test_saving_other_fields_does_not_render_again(self):
+        """Tests that variants are only rendered for a new file."""
+        self._upload(TestHelper.create_image_upload())
+        variants = self.offer.image_variants
+        with mock.patch('utils.image_utils.generate_image_variants') as generate:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.patch(self.url, {'title': "Neuer Titel"}, format='json')
+                self.offer.description = "Neue Beschreibung"
+                self.offer.save()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        generate.assert_not_called()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.image_variants, variants)
+
+    def test_broken_image_leaves_variants_empty(self):
+        """Tests that an unreadable file is logged and skipped."""
+        Offer.objects.filter(pk=self.offer.pk).update(image='offer_pictures/fehlt.png')
+        self.offer.refresh_from_db()
+        with self.assertLogs('utils.image_utils', 'WARNING'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.offer.save()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.image_variants, {})
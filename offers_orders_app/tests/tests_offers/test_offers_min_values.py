@@ -0,0 +1,78 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Offer
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferMinValuesTests(APITestCase):
+    """
+    Tests for the denormalized `min_price` and `min_delivery_time` columns on offers.
+    """
+
+    def setUp(self):
+        """
+        Sets up a business user with an offer and its three details.
+        """
+        self.user = TestHelper.create_user(is_business=True)
+        self.token = TestHelper.create_token(self.user)
+        TestHelper.auth_client(self.client, self.token)
+        self.offer = OfferTestHelper.create_offer(self.user)
+        self.details = OfferTestHelper.create_offer_details(self.offer)
+        self.url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+
+    def test_min_values_set_when_details_created(self):
+        """Tests that creating details fills the stored minimum values."""
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 100.0)
+        self.assertEqual(self.offer.min_delivery_time, 5)
+
+    def test_min_values_updated_on_patch(self):
+        """Tests that patching a detail recalculates the stored minimum values."""
+        payload = {"details": [{"price": 50, "delivery_time_in_days": 2,
+                                "offer_type": "premium"}]}
+        response = self.client.patch(self.url, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 50.0)
+        self.assertEqual(self.offer.min_delivery_time, 2)
+
+    def test_min_values_updated_on_detail_delete(self):
+        """Tests that deleting the cheapest detail recalculates the stored minimum values."""
+        self.details[0].delete()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 120.0)
+        self.assertEqual(self.offer.min_delivery_time, 10)
+
+    def test_saving_stale_instance_keeps_min_values(self):
+        """Tests that a full save of an offer loaded before its details keeps the stored minimums."""
+        stale = OfferTestHelper.create_offer(self.user, title="Stale")
+        OfferTestHelper.create_offer_details(stale)
+        stale.title = "Renamed"
+        stale.save()
+        stale.refresh_from_db()
+        self.assertEqual(stale.title, "Renamed")
+        self.assertEqual(stale.min_price, 100.0)
+        self.assertEqual(stale.min_delivery_time, 5)
+
+    def test_backfill_command(self):
+        """Tests that the backfill command restores stale minimum values."""
+        Offer.objects.update(min_price=None, min_delivery_time=None)
+        call_command('backfill_offer_min_values', stdout=StringIO())
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 100.0)
+        self.assertEqual(self.offer.min_delivery_time, 5)
+
+    def test_filter_max_delivery_time_uses_fastest_detail(self):
+        """Tests that max_delivery_time matches offers whose fastest detail qualifies."""
+        response = self.client.get(
+            reverse('offer-list'), {'max_delivery_time': 5})
+        self.assertEqual(response.data["count"], 1)
+        response = self.client.get(
+            reverse('offer-list'), {'max_delivery_time': 4})
+        self.assertEqual(response.data["count"], 0)
@@ -0,0 +1,72 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Offer, OfferDetail
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferActionQueryCountTests(APITestCase):
+    """
+    Pins the number of queries of the single-offer actions of /api/offers/<pk>/.
+    """
+
+    def setUp(self):
+        """
+        Creates an offer with three details and authenticates its owner.
+        """
+        self.user = TestHelper.create_user(is_business=True)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+        self.offer = OfferTestHelper.create_offer(self.user)
+        OfferTestHelper.create_offer_details(self.offer)
+        self.url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+
+    def _offer_selects(self, queries):
+        """Returns the SELECTs reading full offer rows."""
+        return [query['sql'] for query in queries.captured_queries
+                if query['sql'].startswith('SELECT "offers_orders_app_offer"."id"')]
+
+    def test_retrieve_uses_plain_primary_key_lookup(self):
+        """Tests token, ETag, offer and detail id queries without grouping or sorting."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 4)
+        [offer_select] = self._offer_selects(queries)
+        self.assertNotIn('GROUP BY', offer_select)
+        self.assertNotIn('ORDER BY', offer_select)
+
+    def test_partial_update_of_offer_field(self):
+        """Tests that updating a plain field loads the details once and writes the offer once."""
+        with self.assertNumQueries(9):
+            response = self.client.patch(
+                self.url, {'description': 'Neue Beschreibung'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_partial_update_of_details(self):
+        """Tests that changed details are written with one UPDATE next to the offer update."""
+        payload = {'details': [{'offer_type': 'basic', 'price': 1}]}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 8)
+        [offer_select] = self._offer_selects(queries)
+        self.assertNotIn('GROUP BY', offer_select)
+        self.assertNotIn('ORDER BY', offer_select)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 1)
+
+    def test_destroy_skips_min_value_updates_of_deleted_details(self):
+        """Tests that deleting an offer does not recalculate its minimum values per detail."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(len(queries), 7)
+        updates = [query['sql'] for query in queries.captured_queries
+                   if query['sql'].startswith('UPDATE "offers_orders_app_offer"')]
+        self.assertEqual(updates, [])
+        self.assertFalse(Offer.objects.exists())
+        self.assertFalse(OfferDetail.objects.exists())
@@ -0,0 +1,69 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferSearchTests(APITestCase):
+    """
+    Tests for GET /offers/?search= backed by the full-text index.
+    """
+
+    def setUp(self):
+        """
+        Creates offers with different title and description texts.
+        """
+        self.url = reverse('offer-list')
+        self.user = TestHelper.create_user(is_business=True)
+        self.logo = OfferTestHelper.create_offer(
+            self.user, title="Logo Design", description="Ein Logo für Ihr Unternehmen.")
+        self.website = OfferTestHelper.create_offer(
+            self.user, title="Website", description="Responsive Webdesign mit Logo-Einbindung.")
+        self.video = OfferTestHelper.create_offer(
+            self.user, title="Video Schnitt", description="Professioneller Schnitt.")
+
+    def _search(self, term, **params):
+        """Returns the ids of the offers found for the search term."""
+        response = self.client.get(self.url, {'search': term, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [offer["id"] for offer in response.data["results"]]
+
+    def test_search_matches_title_and_description(self):
+        """Tests that offers are found by words in title or description."""
+        self.assertCountEqual(self._search("logo"), [
+                              self.logo.id, self.website.id])
+        self.assertEqual(self._search("schnitt"), [self.video.id])
+
+    def test_search_matches_word_prefix(self):
+        """Tests that partially typed words match."""
+        self.assertEqual(self._search("webdes"), [self.website.id])
+
+    def test_search_ranks_by_relevance(self):
+        """Tests that the offer mentioning the term more often comes first."""
+        self.assertEqual(self._search("logo")[0], self.logo.id)
+
+    def test_explicit_ordering_overrides_rank(self):
+        """Tests that an ordering parameter replaces the relevance ranking."""
+        ids = self._search("logo", ordering="-updated_at")
+        self.assertCountEqual(ids, [self.logo.id, self.website.id])
+
+    def test_search_follows_updates_and_deletes(self):
+        """Tests that the index follows title changes and deleted offers."""
+        self.video.title = "Animation"
+        self.video.save()
+        self.assertEqual(self._search("animation"), [self.video.id])
+        self.video.delete()
+        self.assertEqual(self._search("animation"), [])
+
+    def test_search_syntax_is_not_interpreted(self):
+        """Tests that query operators and punctuation in the input do not cause errors."""
+        self.assertEqual(self._search('logo NOT "'), [])
+        self.assertEqual(self._search('-'), [self.website.id])
+
+    def test_search_without_words_falls_back_to_like_search(self):
+        """Tests that terms without words are not ignored but matched like the default search."""
+        self.assertEqual(self._search("!!!"), [])
+        OfferTestHelper.create_offer(self.user, title="Logo!!!")
+        self.assertEqual(len(self._search("!!!")), 1)
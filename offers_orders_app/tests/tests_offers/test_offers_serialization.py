@@ -0,0 +1,96 @@
+from django.db.models import Prefetch
+from django.test import RequestFactory
+from django.urls import reverse, set_script_prefix
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from offers_orders_app.api.serializers import (
+    OfferListSerializer, OfferListValuesSerializer, offer_detail_url)
+from offers_orders_app.models import Offer, OfferDetail
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferListValuesSerializerTests(APITestCase):
+    """
+    Tests that the values()-based list serializer matches OfferListSerializer byte for byte.
+    """
+
+    def setUp(self):
+        """
+        Creates offers with and without image and details.
+        """
+        self.user = TestHelper.create_user(is_business=True)
+        self.user.first_name = "Jürgen"
+        self.user.save()
+        with_image = OfferTestHelper.create_offer(self.user, title="Mit Bild")
+        OfferTestHelper.create_offer_details(with_image)
+        Offer.objects.filter(pk=with_image.pk).update(
+            image='offer_pictures/bild.png')
+        plain = OfferTestHelper.create_offer(self.user, title="Ohne Bild")
+        OfferTestHelper.create_offer_details(plain)
+        OfferTestHelper.create_offer(self.user, title="Ohne Details")
+        self.request = RequestFactory().get('/api/offers/', HTTP_HOST='127.0.0.1')
+
+    def _render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_output_is_identical_to_model_serializer(self):
+        """Tests that both serializers render the same JSON bytes."""
+        queryset = Offer.objects.order_by('min_price', 'id')
+        context = {'request': self.request}
+        expected = OfferListSerializer(
+            queryset.select_related('user').prefetch_related(Prefetch(
+                'details', queryset=OfferDetail.objects.order_by('id'))),
+            many=True, context=context).data
+        actual = OfferListValuesSerializer(
+            OfferListValuesSerializer.get_values_queryset(queryset),
+            many=True, context=context).data
+        self.assertEqual(self._render(actual), self._render(expected))
+
+    def test_sparse_output_is_identical_to_model_serializer(self):
+        """Tests that both serializers render the same sparse fieldset."""
+        request = RequestFactory().get(
+            '/api/offers/', {'omit': 'description,details'}, HTTP_HOST='127.0.0.1')
+        queryset = Offer.objects.order_by('min_price', 'id')
+        context = {'request': request}
+        expected = OfferListSerializer(
+            queryset.select_related('user'), many=True, context=context).data
+        fields = OfferListValuesSerializer.get_sparse_fields(request)
+        actual = OfferListValuesSerializer(
+            OfferListValuesSerializer.get_values_queryset(queryset, fields),
+            many=True, context=context).data
+        self.assertEqual(self._render(actual), self._render(expected))
+        self.assertNotIn('details', actual[0])
+
+    def test_page_costs_two_queries(self):
+        """Tests that rows and detail ids are loaded with one query each."""
+        queryset = OfferListValuesSerializer.get_values_queryset(
+            Offer.objects.order_by('id'))
+        with self.assertNumQueries(2):
+            data = OfferListValuesSerializer(
+                queryset, many=True, context={'request': self.request}).data
+        self.assertEqual(len(data), 3)
+
+
+class OfferDetailUrlTests(APITestCase):
+    """
+    Tests that the precomputed offer detail URL matches the reversed URL.
+    """
+
+    def _expected(self, pk):
+        return reverse('offer-details', kwargs={'pk': pk}).replace('/api', '', 1)
+
+    def test_matches_reverse(self):
+        """Tests ids of different lengths, including digits of the placeholder."""
+        for pk in [1, 9, 42, 987654321, 1234567890123]:
+            self.assertEqual(offer_detail_url(pk), self._expected(pk))
+
+    def test_follows_script_prefix(self):
+        """Tests that a different script prefix gets its own URL template."""
+        set_script_prefix('/coderr/')
+        try:
+            self.assertEqual(offer_detail_url(7), self._expected(7))
+            self.assertEqual(offer_detail_url(7), '/coderr/offerdetails/7/')
+        finally:
+            set_script_prefix('/')
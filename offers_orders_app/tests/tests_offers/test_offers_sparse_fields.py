@@ -0,0 +1,85 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.test_utils import TestHelper
+from .test_offers_helpers import OfferTestHelper
+
+
+class OfferSparseFieldsTests(APITestCase):
+    """
+    Tests `?fields=` and `?omit=` on GET /offers/ and GET /offers/{id}/.
+    """
+
+    def setUp(self):
+        """
+        Creates two offers with details and authenticates their owner.
+        """
+        self.user = TestHelper.create_user(is_business=True)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+        self.offers = []
+        for title in ["Logo", "Website"]:
+            offer = OfferTestHelper.create_offer(self.user, title=title)
+            OfferTestHelper.create_offer_details(offer)
+            self.offers.append(offer)
+        self.list_url = reverse('offer-list')
+        self.detail_url = reverse('offer-detail', kwargs={'pk': self.offers[0].pk})
+
+    def _offer_queries(self, queries):
+        """Returns the captured SQL statements that read offers or offer details."""
+        return [query['sql'] for query in queries.captured_queries
+                if 'offers_orders_app_offer' in query['sql']]
+
+    def test_list_fields_renders_and_loads_only_selected_fields(self):
+        """Tests that the page query skips unused columns, joins and the details query."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.list_url, {'fields': 'id,title,min_price,image'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data['results'][0]),
+                         ['id', 'title', 'image', 'min_price'])
+        statements = self._offer_queries(queries)
+        self.assertEqual(len(statements), 2)
+        self.assertNotIn('"description"', statements[1])
+        self.assertNotIn('auth_user', statements[1])
+
+    def test_list_omit_drops_fields(self):
+        """Tests that omitted fields are missing and the others keep their order."""
+        response = self.client.get(
+            self.list_url, {'omit': 'description,user_details,details'})
+        self.assertEqual(list(response.data['results'][0]), [
+            'id', 'user', 'title', 'image', 'image_variants', 'created_at',
+            'updated_at', 'min_price', 'min_delivery_time'])
+
+    def test_unknown_fields_are_ignored(self):
+        """Tests that unknown names do not fail the request."""
+        response = self.client.get(self.list_url, {'fields': 'id,unknown'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data['results'][0]), ['id'])
+
+    def test_sparse_list_with_cursor_pagination(self):
+        """Tests that the cursor still finds its ordering values in sparse rows."""
+        response = self.client.get(self.list_url, {
+            'fields': 'title', 'pagination': 'cursor', 'page_size': 1})
+        self.assertEqual(response.data['results'], [{'title': 'Logo'}])
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.data['results'], [{'title': 'Website'}])
+
+    def test_retrieve_without_details_skips_prefetch(self):
+        """Tests that a single offer without `details` does not query its details."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.detail_url, {'fields': 'id,title'})
+        self.assertEqual(response.data, {'id': self.offers[0].pk, 'title': 'Logo'})
+        self.assertFalse([sql for sql in self._offer_queries(queries)
+                          if 'FROM "offers_orders_app_offerdetail"' in sql
+                          and 'offerdetail"."offer_id" IN' in sql])
+
+    def test_patch_ignores_sparse_parameters(self):
+        """Tests that writes always return the full representation."""
+        response = self.client.patch(
+            f"{self.detail_url}?fields=id", {'title': "Neu"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('details', response.data)
+        self.assertEqual(response.data['title'], "Neu")
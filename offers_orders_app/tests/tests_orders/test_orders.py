@@ -1,5 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework import status
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from offers_orders_app.models import Order
 from utils.test_utils import TestHelper
@@ -191,3 +193,134 @@ class OrderTests(APITestCase):
         url = reverse('order-detail', args=[9999])
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class OrderSparseFieldsTests(APITestCase):
+    """
+    Tests `?fields=` and `?omit=` on the order endpoints.
+    """
+
+    def setUp(self):
+        """Creates two orders of a customer and authenticates the customer."""
+        self.business_user = TestHelper.create_user(
+            username="business_user", is_business=True)
+        self.customer_user = TestHelper.create_user(
+            username="customer_user", is_business=False)
+        TestHelper.auth_client(
+            self.client, TestHelper.create_token(self.customer_user))
+        for title in ["Logo", "Website"]:
+            _, offer_detail = OrdersTestHelper.create_offer_and_detail(
+                user=self.business_user, title=title, detail_title=title)
+            self.order = OrdersTestHelper.create_order(
+                self.customer_user, self.business_user, offer_detail)
+        self.url = reverse('order-list-create')
+
+    def _order_queries(self, queries):
+        """Returns the captured SQL statements reading orders or offer details."""
+        return [query['sql'] for query in queries.captured_queries
+                if 'offers_orders_app_' in query['sql']]
+
+    def test_sparse_fields_load_only_their_columns(self):
+        """Tests that only the selected order columns are read."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'fields': 'id,status'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data[0]), ['id', 'status'])
+        statements = self._order_queries(queries)
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn('"features"', statements[0])
+
+    def test_package_fields_are_read_without_join(self):
+        """Tests that the copied package fields are read from the order rows only."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'fields': 'title,price'})
+        self.assertEqual(sorted(order['title'] for order in response.data),
+                         ["Logo", "Website"])
+        statements = self._order_queries(queries)
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn('offerdetail', statements[0])
+
+    def test_retrieve_omit(self):
+        """Tests that a single order honours `?omit=`."""
+        url = reverse('order-detail', kwargs={'pk': self.order.pk})
+        response = self.client.get(url, {'omit': 'features,created_at,updated_at'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('features', response.data)
+        self.assertEqual(response.data['title'], "Website")
+
+
+class OrderQueryCountTests(APITestCase):
+    """
+    Tests that the order endpoints run a constant number of queries.
+    """
+
+    def setUp(self):
+        """Creates a business user and authenticates it."""
+        self.business_user = TestHelper.create_user(
+            username="business_user", is_business=True)
+        self.customer_user = TestHelper.create_user(username="customer_user")
+        TestHelper.auth_client(
+            self.client, TestHelper.create_token(self.business_user))
+        self.url = reverse('order-list-create')
+
+    def _create_orders(self, count):
+        """Creates `count` orders, each for its own offer detail."""
+        orders = []
+        for index in range(count):
+            _, offer_detail = OrdersTestHelper.create_offer_and_detail(
+                user=self.business_user, title=f"Offer {index}")
+            orders.append(OrdersTestHelper.create_order(
+                self.customer_user, self.business_user, offer_detail))
+        return orders
+
+    def test_list_query_count_does_not_grow_with_orders(self):
+        """Tests that listing one or ten orders runs the same two queries."""
+        self._create_orders(1)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 1)
+        self._create_orders(9)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 10)
+        self.assertEqual(response.data[9]['title'], "Logo Design")
+
+    def test_cursor_page_query_count(self):
+        """Tests that a cursor page runs the token and the page query only."""
+        self._create_orders(5)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_retrieve_and_patch_query_count(self):
+        """
+        Tests that retrieving and updating an order read it with one query.
+        The update runs in a savepoint with one UPDATE per affected status counter.
+        """
+        [order, completed] = self._create_orders(2)
+        completed.status = 'completed'
+        completed.save()
+        url = reverse('order-detail', kwargs={'pk': order.pk})
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.data['price'], 150.0)
+        with self.assertNumQueries(7):
+            response = self.client.patch(url, {'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], "Logo Design")
+
+    def test_create_query_count(self):
+        """
+        Tests that creating an order reads the token with the profile and the offer detail
+        with its business user id, then inserts in one savepoint with the counter update.
+        """
+        _, offer_detail = OrdersTestHelper.create_offer_and_detail(user=self.business_user)
+        OrdersTestHelper.create_order(self.customer_user, self.business_user, offer_detail)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.customer_user))
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                self.url, {'offer_detail_id': offer_detail.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(pk=response.data['id'])
+        self.assertEqual(order.business_user, self.business_user)
+        self.assertEqual(response.data['business_user'], self.business_user.id)
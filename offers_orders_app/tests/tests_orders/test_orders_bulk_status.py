@@ -0,0 +1,98 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import BusinessOrderCounter, Order
+from utils.test_utils import TestHelper
+from .test_orders_helpers import OrdersTestHelper
+
+
+class OrderBulkStatusTests(APITestCase):
+    """
+    Tests for PATCH /orders/bulk-status/.
+    """
+
+    def setUp(self):
+        """
+        Creates three orders of a business user, one order of another business user,
+        and authenticates the first business user.
+        """
+        self.url = reverse('order-bulk-status')
+        self.business_user = TestHelper.create_user(
+            username="business_user", is_business=True)
+        self.other_business = TestHelper.create_user(
+            username="other_business", is_business=True)
+        self.customer_user = TestHelper.create_user(username="customer_user")
+        _, offer_detail = OrdersTestHelper.create_offer_and_detail(self.business_user)
+        _, other_detail = OrdersTestHelper.create_offer_and_detail(self.other_business)
+        self.orders = [
+            OrdersTestHelper.create_order(
+                self.customer_user, self.business_user, offer_detail, status=order_status)
+            for order_status in ['in_progress', 'in_progress', 'cancelled']
+        ]
+        self.other_order = OrdersTestHelper.create_order(
+            self.customer_user, self.other_business, other_detail)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.business_user))
+
+    def _counts(self):
+        """Returns the stored counters of the business user by status."""
+        return dict(BusinessOrderCounter.objects.filter(
+            business_user=self.business_user).values_list('status', 'count'))
+
+    def test_bulk_status_update(self):
+        """Tests that all orders get the status, a newer updated_at and moved counters."""
+        before = {order.pk: order.updated_at for order in self.orders}
+        ids = [order.pk for order in self.orders]
+        response = self.client.patch(
+            self.url, {'ids': ids, 'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'ids': ids, 'status': 'completed', 'updated': 3})
+        for order in Order.objects.filter(pk__in=ids):
+            self.assertEqual(order.status, 'completed')
+            self.assertGreater(order.updated_at, before[order.pk])
+        self.assertEqual(self._counts(), {'in_progress': 0, 'cancelled': 0, 'completed': 3})
+
+    def test_orders_with_target_status_are_not_touched(self):
+        """Tests that orders already in the target status keep updated_at and counters."""
+        cancelled = self.orders[2]
+        response = self.client.patch(
+            self.url, {'ids': [self.orders[0].pk, cancelled.pk], 'status': 'cancelled'},
+            format='json')
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(Order.objects.get(pk=cancelled.pk).updated_at, cancelled.updated_at)
+        self.assertEqual(self._counts(), {'in_progress': 1, 'cancelled': 2})
+
+    def test_runs_one_select_and_one_update(self):
+        """
+        Tests the query count: token, then ownership check, UPDATE and one update per
+        affected counter inside a savepoint.
+        """
+        ids = [order.pk for order in self.orders[:2]]
+        with self.assertNumQueries(7):
+            response = self.client.patch(
+                self.url, {'ids': ids, 'status': 'cancelled'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_foreign_or_missing_orders_return_404_and_change_nothing(self):
+        """Tests that ids of other users' orders or unknown ids reject the whole request."""
+        ids = [self.orders[0].pk, self.other_order.pk, 9999]
+        response = self.client.patch(
+            self.url, {'ids': ids, 'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['ids'], [self.other_order.pk, 9999])
+        self.assertFalse(Order.objects.filter(status='completed').exists())
+
+    def test_invalid_payload_returns_400(self):
+        """Tests validation of the status and the id list."""
+        for payload in [{'ids': [self.orders[0].pk], 'status': 'shipped'},
+                        {'ids': [], 'status': 'completed'},
+                        {'status': 'completed'}]:
+            response = self.client.patch(self.url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_customer_user_gets_403(self):
+        """Tests that only business users can change order statuses."""
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.customer_user))
+        response = self.client.patch(
+            self.url, {'ids': [self.orders[0].pk], 'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,8 +1,13 @@
 
+from io import StringIO
+
 from rest_framework.test import APITestCase
 from rest_framework import status
+from django.core.management import call_command
 from django.urls import reverse
 
+from offers_orders_app.models import BusinessOrderCounter, Order
+
 from utils.test_utils import TestHelper
 from offers_orders_app.tests.tests_orders.test_orders_helpers import OrdersTestHelper
 
@@ -91,3 +96,111 @@ class OrderCountTests(APITestCase):
                       args=[self.non_existent_business_user_id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    # -------------------- Tests für /order-stats/{business_user_id}/ --------------------
+
+    def test_order_stats_success(self):
+        """Tests that the counts of all statuses are returned."""
+        OrdersTestHelper.create_order(
+            self.customer_user, self.business_user, self.offer_detail, status="completed")
+        url = reverse('order-stats', args=[self.business_user.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            "in_progress": 1, "completed": 2, "cancelled": 0, "total": 3})
+
+    def test_order_stats_without_orders(self):
+        """Tests that a business user without orders gets zero counts."""
+        other = TestHelper.create_user(username="other_business", is_business=True)
+        response = self.client.get(reverse('order-stats', args=[other.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            "in_progress": 0, "completed": 0, "cancelled": 0, "total": 0})
+
+    def test_order_stats_of_customer_user_returns_404(self):
+        """Tests that only business users have order statistics."""
+        response = self.client.get(reverse('order-stats', args=[self.customer_user.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_count_endpoints_run_one_query(self):
+        """Tests that each count endpoint runs a single query besides authentication."""
+        for name in ['order-stats', 'order-count', 'completed-order-count']:
+            with self.assertNumQueries(2):
+                response = self.client.get(reverse(name, args=[self.business_user.id]))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class BusinessOrderCounterTests(APITestCase):
+    """
+    Tests that the per-business order counters follow order creation, status changes and deletion.
+    """
+
+    def setUp(self):
+        """Creates a business user with an offer detail and authenticates a customer."""
+        self.business_user = TestHelper.create_user(
+            username="business_user", is_business=True)
+        self.customer_user = TestHelper.create_user(username="customer_user")
+        _, self.offer_detail = OrdersTestHelper.create_offer_and_detail(
+            user=self.business_user)
+        TestHelper.auth_client(
+            self.client, TestHelper.create_token(self.customer_user))
+
+    def _counts(self):
+        """Returns the stored counters of the business user by status."""
+        return dict(BusinessOrderCounter.objects.filter(
+            business_user=self.business_user).values_list('status', 'count'))
+
+    def test_counters_follow_order_lifecycle(self):
+        """Tests counting on POST, moving on PATCH and uncounting on DELETE."""
+        response = self.client.post(
+            reverse('order-list-create'), {'offer_detail_id': self.offer_detail.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._counts(), {'in_progress': 1})
+
+        url = reverse('order-detail', args=[response.data['id']])
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.business_user))
+        self.client.patch(url, {'status': 'completed'}, format='json')
+        self.assertEqual(self._counts(), {'in_progress': 0, 'completed': 1})
+
+        admin = TestHelper.create_user(username="admin_user", is_staff=True)
+        TestHelper.auth_client(self.client, TestHelper.create_token(admin))
+        self.client.delete(url)
+        self.assertEqual(self._counts(), {'in_progress': 0, 'completed': 0})
+
+    def test_patch_without_status_change_keeps_counters(self):
+        """Tests that saving an order with the same status does not touch the counters."""
+        order = OrdersTestHelper.create_order(
+            self.customer_user, self.business_user, self.offer_detail)
+        order = Order.objects.get(pk=order.pk)
+        order.save()
+        self.assertEqual(self._counts(), {'in_progress': 1})
+
+    def test_count_view_reads_counters(self):
+        """Tests that the count endpoints report the stored counters."""
+        BusinessOrderCounter.objects.create(
+            business_user=self.business_user, status='in_progress', count=42)
+        response = self.client.get(reverse('order-count', args=[self.business_user.id]))
+        self.assertEqual(response.data, {"order_count": 42})
+
+    def test_reconcile_command_reports_and_fixes_drift(self):
+        """Tests that the reconciliation recomputes drifted and missing counters."""
+        for _ in range(2):
+            OrdersTestHelper.create_order(
+                self.customer_user, self.business_user, self.offer_detail, status='completed')
+        BusinessOrderCounter.objects.filter(status='completed').update(count=5)
+        BusinessOrderCounter.objects.create(
+            business_user=self.business_user, status='cancelled', count=1)
+
+        out = StringIO()
+        call_command('reconcile_order_counters', '--dry-run', stdout=out)
+        self.assertIn("completed: stored 5, actual 2", out.getvalue())
+        self.assertEqual(self._counts(), {'completed': 5, 'cancelled': 1})
+
+        out = StringIO()
+        call_command('reconcile_order_counters', stdout=out)
+        self.assertIn("Corrected 2 counters.", out.getvalue())
+        self.assertEqual(self._counts(), {'completed': 2, 'cancelled': 0})
+
+        out = StringIO()
+        call_command('reconcile_order_counters', stdout=out)
+        self.assertIn("All order counters are correct.", out.getvalue())
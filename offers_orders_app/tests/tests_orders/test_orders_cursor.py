@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Order
+from utils.test_utils import TestHelper
+from .test_orders_helpers import OrdersTestHelper
+
+
+class OrderCursorPaginationTests(APITestCase):
+    """
+    Tests for GET /orders/?pagination=cursor and the status filter.
+    """
+
+    def setUp(self):
+        """
+        Creates orders where the authenticated user is the business user or the customer,
+        with duplicate creation times, plus an order of two other users.
+        """
+        self.url = reverse('order-list-create')
+        self.user = TestHelper.create_user(username="seller", is_business=True)
+        other_business = TestHelper.create_user(username="other_business", is_business=True)
+        customer = TestHelper.create_user(username="customer")
+        _, own_detail = OrdersTestHelper.create_offer_and_detail(self.user)
+        _, other_detail = OrdersTestHelper.create_offer_and_detail(other_business)
+        now = timezone.now()
+        self.orders = []
+        for index, days in enumerate([0, 1, 1, 2, 3, 3, 4]):
+            if index % 2:
+                order = OrdersTestHelper.create_order(self.user, other_business, other_detail)
+            else:
+                order = OrdersTestHelper.create_order(
+                    customer, self.user, own_detail,
+                    status='completed' if index < 4 else 'in_progress')
+            Order.objects.filter(pk=order.pk).update(created_at=now - timedelta(days=days))
+            self.orders.append(order)
+        OrdersTestHelper.create_order(customer, other_business, other_detail)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+
+    def _expected_ids(self, orders):
+        """Returns the ids of the orders sorted by -created_at, -id."""
+        orders = Order.objects.filter(pk__in=[order.pk for order in orders])
+        return list(orders.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def _collect_pages(self, params):
+        """Follows next links and returns the result ids of every page."""
+        pages = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([order["id"] for order in response.data["results"]])
+            if response.data["next"] is None:
+                return pages, response
+            response = self.client.get(response.data["next"])
+
+    def test_pages_cover_customer_and_business_orders_newest_first(self):
+        """Tests that pages follow -created_at, -id across both roles of the user."""
+        pages, _ = self._collect_pages({'pagination': 'cursor', 'page_size': 3})
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        ids = [order_id for page in pages for order_id in page]
+        self.assertEqual(ids, self._expected_ids(self.orders))
+
+    def test_previous_link_returns_prior_page(self):
+        """Tests that following previous from the last page returns the page before it."""
+        pages, last = self._collect_pages({'pagination': 'cursor', 'page_size': 3})
+        response = self.client.get(last.data["previous"])
+        self.assertEqual([order["id"] for order in response.data["results"]], pages[-2])
+
+    def test_status_filter(self):
+        """Tests filtering by status with and without pagination."""
+        completed = [order for order in self.orders if order.status == 'completed']
+        pages, _ = self._collect_pages(
+            {'pagination': 'cursor', 'page_size': 1, 'status': 'completed'})
+        self.assertEqual([page[0] for page in pages], self._expected_ids(completed))
+        response = self.client.get(self.url, {'status': 'completed'})
+        self.assertEqual({order["id"] for order in response.data},
+                         {order.id for order in completed})
+
+    def test_invalid_status_returns_400(self):
+        """Tests that unknown status values are rejected."""
+        response = self.client.get(self.url, {'status': 'shipped'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_page_is_read_with_one_union_query(self):
+        """Tests that a page is read with one UNION query without OR and without COUNT."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        [order_query] = [query['sql'] for query in queries.captured_queries
+                         if 'offers_orders_app_order' in query['sql']]
+        self.assertIn(' UNION ', order_query)
+        self.assertNotIn('COUNT(', order_query)
+        self.assertNotIn(' OR ', order_query)
+
+    def test_without_pagination_returns_plain_list(self):
+        """Tests that the default response stays an unpaginated list."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), len(self.orders))
@@ -0,0 +1,62 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_orders_app.models import Order
+from utils.test_utils import TestHelper
+from .test_orders_helpers import OrdersTestHelper
+
+
+class OrderSnapshotTests(APITestCase):
+    """
+    Tests that orders keep the package fields of the offer detail they were created from.
+    """
+
+    def setUp(self):
+        """Creates an offer detail of a business user and authenticates a customer."""
+        self.business_user = TestHelper.create_user(
+            username="business_user", is_business=True)
+        self.customer_user = TestHelper.create_user(username="customer_user")
+        self.offer, self.offer_detail = OrdersTestHelper.create_offer_and_detail(
+            user=self.business_user)
+        TestHelper.auth_client(
+            self.client, TestHelper.create_token(self.customer_user))
+
+    def _create_order(self):
+        """Places an order for the offer detail and returns the response data."""
+        response = self.client.post(
+            reverse('order-list-create'), {'offer_detail_id': self.offer_detail.id},
+            format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def test_package_fields_are_copied_on_create(self):
+        """Tests that the order row stores the package fields of the offer detail."""
+        data = self._create_order()
+        order = Order.objects.get(pk=data['id'])
+        for field in Order.OFFER_DETAIL_FIELDS:
+            self.assertEqual(getattr(order, field), getattr(self.offer_detail, field))
+        self.assertEqual(data['price'], 150.0)
+        self.assertEqual(data['features'], ["Logo Design", "Visitenkarten"])
+
+    def test_offer_edit_does_not_change_order(self):
+        """Tests that editing the offer detail afterwards keeps the purchased values."""
+        data = self._create_order()
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.business_user))
+        response = self.client.patch(
+            reverse('offer-detail', kwargs={'pk': self.offer.pk}),
+            {'details': [{'offer_type': 'basic', 'title': "Neu", 'price': 999}]},
+            format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(reverse('order-detail', kwargs={'pk': data['id']}))
+        self.assertEqual(response.data['title'], "Logo Design")
+        self.assertEqual(response.data['price'], 150.0)
+
+    def test_order_survives_offer_deletion(self):
+        """Tests that deleting the offer keeps the order and its package fields."""
+        data = self._create_order()
+        self.offer.delete()
+        order = Order.objects.get(pk=data['id'])
+        self.assertIsNone(order.offer_detail_id)
+        self.assertEqual(order.title, "Logo Design")
+        self.assertEqual(str(order), f"Order {order.id} - Logo Design (in_progress)")
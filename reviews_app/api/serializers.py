@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from reviews_app.models import Review
+from utils.serializer_utils import SparseFieldsetMixin
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializes review data, including validation to ensure a reviewer can only review a business user once.
     """
@@ -38,7 +38,7 @@ class ReviewListCreateAPIView(generics.ListCreateAPIView):
             queryset = queryset.filter(reviewer_id=reviewer_id)
         if ordering in ['updated_at', 'rating', '-updated_at', '-rating']:
             queryset = queryset.order_by(ordering)
-        return queryset
+        return ReviewSerializer.get_sparse_queryset(queryset, self.request)
 
     def perform_create(self, serializer):
         """
@@ -63,3 +63,9 @@ class ReviewRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         if self.request.method in ['PATCH', 'DELETE']:
             return [IsReviewer()]
         return super().get_permissions()
+
+    def get_queryset(self):
+        """
+        Loads only the columns of the requested sparse fieldset on GET.
+        """
+        return ReviewSerializer.get_sparse_queryset(super().get_queryset(), self.request)
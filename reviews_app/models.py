@@ -21,6 +21,14 @@ class Review(models.Model):
     class Meta:
         unique_together = ('business_user', 'reviewer')
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['business_user', '-updated_at'],
+                         name='review_business_updated_idx'),
+            models.Index(fields=['reviewer', '-updated_at'],
+                         name='review_reviewer_updated_idx'),
+            models.Index(fields=['-updated_at'],
+                         name='review_updated_at_idx'),
+        ]
 
     def __str__(self):
         return f"Review by {self.reviewer.username} for {self.business_user.username}"
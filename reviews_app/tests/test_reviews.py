@@ -174,3 +174,31 @@ class ReviewRetrieveUpdateDestroyTests(APITestCase):
         response = self.client.delete(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertTrue(Review.objects.filter(id=self.review.id).exists())
+
+
+class ReviewSparseFieldsTests(APITestCase):
+    """
+    Tests `?fields=` and `?omit=` on the review endpoints.
+    """
+
+    def setUp(self):
+        """Creates a review and authenticates its reviewer."""
+        business_user = TestHelper.create_user(
+            username="business_user", is_business=True)
+        reviewer = TestHelper.create_user(username="reviewer")
+        TestHelper.auth_client(self.client, TestHelper.create_token(reviewer))
+        self.review = ReviewTestHelper.create_review(business_user, reviewer)
+
+    def test_list_fields(self):
+        """Tests that only the selected fields are returned."""
+        response = self.client.get(
+            reverse('review-list-create'), {'fields': 'id,rating'})
+        self.assertEqual(response.data, [{'id': self.review.id, 'rating': 4}])
+
+    def test_retrieve_omit(self):
+        """Tests that omitted fields are missing from a single review."""
+        url = reverse('review-detail', kwargs={'pk': self.review.pk})
+        response = self.client.get(url, {'omit': 'description'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('description', response.data)
+        self.assertEqual(response.data['rating'], 4)
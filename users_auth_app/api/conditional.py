@@ -0,0 +1,26 @@
+from utils.conditional_utils import cached_validator, make_etag
+from users_auth_app.models import UserProfile
+
+
+def _profile_state(request, pk):
+    """
+    Loads the change markers of a profile together with the user fields it exposes.
+    """
+    def load():
+        return UserProfile.objects.filter(user_id=pk).values_list(
+            'updated_at', 'user__username', 'user__first_name',
+            'user__last_name', 'user__email'
+        ).first()
+    return cached_validator(request, f'profile:{pk}', load)
+
+
+def profile_etag(request, pk=None, **kwargs):
+    """Returns the ETag of a profile or None if it does not exist."""
+    state = _profile_state(request, pk)
+    return make_etag('profile', pk, state) if state else None
+
+
+def profile_last_modified(request, pk=None, **kwargs):
+    """Returns the last modification time of a profile or None if it does not exist."""
+    state = _profile_state(request, pk)
+    return state[0] if state else None
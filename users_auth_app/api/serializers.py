@@ -5,6 +5,17 @@ from rest_framework.authtoken.models import Token
 from rest_framework.validators import UniqueValidator
 
 from users_auth_app.models import UserProfile
+from utils.image_utils import ImageVariantsField
+from utils.serializer_utils import SparseFieldsetMixin
+
+FILE_STORAGE = UserProfile._meta.get_field('file').storage
+USER_FIELD_COLUMNS = {
+    'username': ['user__username'],
+    'first_name': ['user__first_name'],
+    'last_name': ['user__last_name'],
+    'email': ['user__email'],
+    'created_at': ['user__date_joined'],
+}
 
 
 class RegistrationSerializer(serializers.Serializer):
@@ -80,7 +91,7 @@ class RegistrationSerializer(serializers.Serializer):
         }
 
 
-class UserProfileDetailSerializer(serializers.ModelSerializer):
+class UserProfileDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializes detailed user profile data, including nested user fields and read-only metadata like creation date."""
     username = serializers.CharField(source='user.username', read_only=True)
     email = serializers.EmailField(source='user.email', required=False)
@@ -89,12 +100,15 @@ class UserProfileDetailSerializer(serializers.ModelSerializer):
     last_name = serializers.CharField(source='user.last_name', required=False)
     created_at = serializers.DateTimeField(
         source='user.date_joined', read_only=True)
+    file_variants = ImageVariantsField(storage=FILE_STORAGE)
+
+    sparse_field_columns = USER_FIELD_COLUMNS
 
     class Meta:
         model = UserProfile
         fields = [
             'user', 'username', 'first_name', 'last_name',
-            'file', 'location', 'tel', 'description',
+            'file', 'file_variants', 'location', 'tel', 'description',
             'working_hours', 'type', 'email', 'created_at',
         ]
         read_only_fields = ['user', 'username', 'type', 'created_at']
@@ -118,17 +132,25 @@ class UserProfileDetailSerializer(serializers.ModelSerializer):
         return instance
 
 
-class BusinessUserProfileSerializer(serializers.ModelSerializer):
+class BusinessUserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializes business user profile data, including contact details, description, and working hours."""
+    file_variants = ImageVariantsField(storage=FILE_STORAGE)
+
+    sparse_field_columns = USER_FIELD_COLUMNS
+
     class Meta:
         model = UserProfile
-        fields = ['user', 'username', 'first_name', 'last_name', 'file', 'location',
+        fields = ['user', 'username', 'first_name', 'last_name', 'file', 'file_variants', 'location',
                   'tel', 'description', 'working_hours', 'type']
 
 
-class CustomerUserProfileSerializer(serializers.ModelSerializer):
+class CustomerUserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializes customer user profile data, including basic contact details and description."""
+    file_variants = ImageVariantsField(storage=FILE_STORAGE)
+
+    sparse_field_columns = USER_FIELD_COLUMNS
+
     class Meta:
         model = UserProfile
-        fields = ['user', 'username', 'first_name', 'last_name', 'file',
+        fields = ['user', 'username', 'first_name', 'last_name', 'file', 'file_variants',
                   'tel', 'description', 'type']
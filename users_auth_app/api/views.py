@@ -3,6 +3,8 @@ import datetime
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
@@ -15,6 +17,7 @@ from rest_framework.authtoken.models import Token
 from users_auth_app.models import UserProfile
 from .serializers import RegistrationSerializer, UserProfileDetailSerializer, BusinessUserProfileSerializer, CustomerUserProfileSerializer
 from .permissions import ReadOnlyOrOwnerUpdateOrAdmin
+from .conditional import profile_etag, profile_last_modified
 
 
 class RegistrationView(APIView):
@@ -124,13 +127,17 @@ class UserProfileDetailView(APIView):
     """
     permission_classes = [IsAuthenticated, ReadOnlyOrOwnerUpdateOrAdmin]
 
+    @method_decorator(condition(etag_func=profile_etag, last_modified_func=profile_last_modified))
     def get(self, request, pk):
         """
         Retrieves the user profile details for a given profile ID.
-        Returns a success response with profile data or a 404 error if not found.
+        Returns a success response with profile data, 304 if the client's copy is current,
+        or a 404 error if not found.
         """
-        profile = get_object_or_404(UserProfile, user_id=pk)
-        serializer = UserProfileDetailSerializer(profile)
+        queryset = UserProfileDetailSerializer.get_sparse_queryset(
+            UserProfile.objects.all(), request)
+        profile = get_object_or_404(queryset, user_id=pk)
+        serializer = UserProfileDetailSerializer(profile, context={'view': self})
         return Response(serializer.data)
 
     def patch(self, request, pk):
@@ -164,7 +171,8 @@ class UserProfileListView(ListAPIView):
         profile_type = self.kwargs.get('type')
         if profile_type not in ['business', 'customer']:
             raise ValidationError({"detail": "Invalid profile type"})
-        return UserProfile.objects.filter(type=profile_type)
+        return self.get_serializer_class().get_sparse_queryset(
+            UserProfile.objects.filter(type=profile_type), self.request)
 
     def get_serializer_class(self):
         """
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsersAuthAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users_auth_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
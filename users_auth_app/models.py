@@ -12,6 +12,7 @@ class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     file = models.ImageField(
         upload_to='profile_pictures/', null=True, blank=True)
+    file_variants = models.JSONField(default=dict, blank=True, editable=False)
     location = models.CharField(
         max_length=255, null=False, blank=True, default='-')
     tel = models.CharField(max_length=20, null=False,
@@ -23,6 +24,12 @@ class UserProfile(models.Model):
     type = models.CharField(
         max_length=50, choices=[('business', 'Business'), ('customer', 'Customer')]
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['type'], name='userprofile_type_idx'),
+        ]
 
     @property
     def username(self):
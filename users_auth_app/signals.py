@@ -0,0 +1,15 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from utils.image_utils import schedule_image_variants
+from .models import UserProfile
+
+
+@receiver(post_save, sender=UserProfile)
+def generate_profile_file_variants(sender, instance, update_fields=None, **kwargs):
+    """
+    Renders thumbnails and WebP variants of a newly uploaded profile picture in the background.
+    """
+    if update_fields is not None and 'file' not in update_fields:
+        return
+    schedule_image_variants(instance, 'file', 'file_variants')
@@ -0,0 +1,41 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.test_utils import TestHelper
+
+
+class ProfileConditionalGetTests(APITestCase):
+    """
+    Tests for ETag and Last-Modified handling on GET /profile/{pk}/.
+    """
+
+    def setUp(self):
+        """Creates and authenticates a business user."""
+        self.user = TestHelper.create_user(is_business=True)
+        self.token = TestHelper.create_token(self.user)
+        TestHelper.auth_client(self.client, self.token)
+        self.url = reverse('profile-detail', kwargs={'pk': self.user.pk})
+
+    def test_if_none_match_returns_304(self):
+        """Tests that an unchanged profile returns 304 for a matching ETag."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_patch_changes_etag(self):
+        """Tests that updating the profile invalidates the ETag."""
+        etag = self.client.get(self.url)['ETag']
+        self.client.patch(self.url, {"first_name": "Anna"}, format='json')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["first_name"], "Anna")
+
+    def test_missing_profile_returns_404(self):
+        """Tests that conditional handling keeps the 404 for unknown profiles."""
+        url = reverse('profile-detail', kwargs={'pk': 99999})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"abc"')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
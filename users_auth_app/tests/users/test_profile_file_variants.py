@@ -0,0 +1,58 @@
+import shutil
+import tempfile
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users_auth_app.models import UserProfile
+from utils.test_utils import TestHelper
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_VARIANTS_SYNC=True, IMAGE_VARIANT_WIDTHS=[320])
+class ProfileFileVariantsTests(APITestCase):
+    """
+    Tests the profile picture variants exposed by the profile endpoints.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Creates a business user with a profile picture and authenticates it."""
+        self.user = TestHelper.create_user(is_business=True)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+        self.url = reverse('profile-detail', kwargs={'pk': self.user.pk})
+        self.etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            profile = UserProfile.objects.get(user=self.user)
+            profile.file = TestHelper.create_image_upload('profil.png')
+            profile.save()
+
+    def test_profile_detail_exposes_variants(self):
+        """Tests that the detail view lists the variant URLs and gets a new ETag."""
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        variants = response.data['file_variants']
+        self.assertEqual(set(variants), {'320w', '320w_webp'})
+        self.assertTrue(variants['320w'].startswith('/media/profile_pictures/variants/profil'))
+
+    def test_profile_list_exposes_variants(self):
+        """Tests that the business profile list lists the variant URLs."""
+        response = self.client.get(reverse('profiles-list', kwargs={'type': 'business'}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data[0]['file_variants']['320w_webp'].endswith('_320w.webp'))
+
+    def test_removing_the_file_clears_variants(self):
+        """Tests that variants are cleared together with the profile picture."""
+        with self.captureOnCommitCallbacks(execute=True):
+            profile = UserProfile.objects.get(user=self.user)
+            profile.file = None
+            profile.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['file_variants'], {})
@@ -0,0 +1,47 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from utils.test_utils import TestHelper
+
+
+class ProfileSparseFieldsTests(APITestCase):
+    """
+    Tests `?fields=` and `?omit=` on the profile endpoints.
+    """
+
+    def setUp(self):
+        """Creates two business users and authenticates the first one."""
+        self.user = TestHelper.create_user(is_business=True)
+        TestHelper.create_user(username='anna', is_business=True)
+        TestHelper.auth_client(self.client, TestHelper.create_token(self.user))
+
+    def _profile_queries(self, queries):
+        """Returns the captured SQL statements reading profiles, except the token lookup."""
+        return [query['sql'] for query in queries.captured_queries
+                if 'users_auth_app_userprofile' in query['sql']
+                and 'authtoken_token' not in query['sql']]
+
+    def test_list_fields_load_user_columns_with_one_join(self):
+        """Tests that user fields of all profiles are read with a single query."""
+        url = reverse('profiles-list', kwargs={'type': 'business'})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'fields': 'user,username,type'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(profile['username'] for profile in response.data),
+                         ['anna', 'john'])
+        self.assertEqual(list(response.data[0]), ['user', 'username', 'type'])
+        statements = self._profile_queries(queries)
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn('"description"', statements[0])
+
+    def test_detail_omit(self):
+        """Tests that omitted fields are missing from the profile detail."""
+        url = reverse('profile-detail', kwargs={'pk': self.user.pk})
+        response = self.client.get(url, {'omit': 'email,description,file_variants'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('email', response.data)
+        self.assertNotIn('description', response.data)
+        self.assertEqual(response.data['username'], 'john')
@@ -56,11 +56,11 @@ class ProfileListViewTests(APITestCase):
         """Returns the expected fields for a given profile type."""
         if profile_type == 'business':
             return {
-                'user', 'username', 'first_name', 'last_name', 'file', 'location', 'tel', 'description', 'working_hours', 'type'
+                'user', 'username', 'first_name', 'last_name', 'file', 'file_variants', 'location', 'tel', 'description', 'working_hours', 'type'
             }
         elif profile_type == 'customer':
             return {
-                'user', 'username', 'first_name', 'last_name', 'file', 'tel', 'description', 'type'
+                'user', 'username', 'first_name', 'last_name', 'file', 'file_variants', 'tel', 'description', 'type'
             }
         return set()
 
@@ -0,0 +1,22 @@
+import hashlib
+
+
+def make_etag(*parts):
+    """
+    Builds an entity tag from cheap change markers of a resource.
+    """
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def cached_validator(request, name, loader):
+    """
+    Returns the validator data for `name`, loading it only once per request.
+    `condition()` asks for the ETag and Last-Modified separately, both share one query.
+    """
+    validators = getattr(request, '_conditional_validators', None)
+    if validators is None:
+        validators = {}
+        request._conditional_validators = validators
+    if name not in validators:
+        validators[name] = loader()
+    return validators[name]
@@ -0,0 +1,171 @@
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VARIANT_WIDTHS = [320, 640]
+MAX_VARIANT_HEIGHT = 10000
+
+_executor = None
+
+
+def get_executor():
+    """Returns the process-wide thread pool that renders image variants."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'IMAGE_VARIANT_WORKERS', 2),
+            thread_name_prefix='image-variants')
+    return _executor
+
+
+def variant_file_name(name, width, extension):
+    """Returns the storage name of a variant next to the original, e.g. `offer_pictures/variants/a_320w.webp`."""
+    directory, file_name = posixpath.split(name)
+    stem = posixpath.splitext(file_name)[0]
+    return posixpath.join(directory, 'variants', f'{stem}_{width}w.{extension}')
+
+
+def _save_image(storage, image, name, image_format, **options):
+    """Encodes the image and saves it to the storage, returning the stored name."""
+    buffer = BytesIO()
+    image.save(buffer, image_format, **options)
+    return storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def generate_image_variants(field_file):
+    """
+    Renders a fixed-width thumbnail and a WebP version for every configured width.
+    Thumbnails are JPEG, or PNG if the image has transparency. Images are never upscaled.
+    Returns `{'source': name, 'files': {variant: stored name}}`.
+    """
+    storage = field_file.storage
+    with storage.open(field_file.name, 'rb') as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+    transparent = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if transparent else 'RGB')
+    thumbnail_format, extension = ('PNG', 'png') if transparent else ('JPEG', 'jpg')
+
+    files = {}
+    for width in getattr(settings, 'IMAGE_VARIANT_WIDTHS', DEFAULT_VARIANT_WIDTHS):
+        resized = image.copy()
+        resized.thumbnail((width, MAX_VARIANT_HEIGHT), Image.LANCZOS)
+        files[f'{width}w'] = _save_image(
+            storage, resized, variant_file_name(field_file.name, width, extension),
+            thumbnail_format, optimize=True)
+        files[f'{width}w_webp'] = _save_image(
+            storage, resized, variant_file_name(field_file.name, width, 'webp'),
+            'WEBP', quality=80)
+    return {'source': field_file.name, 'files': files}
+
+
+def schedule_image_variants(instance, field_name, variants_field_name, on_stored=None):
+    """
+    Renders the variants of a newly uploaded image in the background once the
+    transaction commits. Does nothing if the variants belong to the current file.
+    `on_stored` is called after the variants were written, e.g. to invalidate caches.
+    """
+    name = getattr(instance, field_name).name or None
+    variants = getattr(instance, variants_field_name) or {}
+    if variants.get('source') == name:
+        return
+    task = partial(render_image_variants, type(instance), instance.pk, field_name,
+                   variants_field_name, name, on_stored)
+    transaction.on_commit(partial(_submit, task))
+
+
+def _submit(task):
+    """Runs the task in the thread pool, or right away if `IMAGE_VARIANTS_SYNC` is set."""
+    if getattr(settings, 'IMAGE_VARIANTS_SYNC', False):
+        task()
+    else:
+        get_executor().submit(_run_in_thread, task)
+
+
+def _run_in_thread(task):
+    """Runs a task and closes the database connections the worker thread opened."""
+    try:
+        task()
+    finally:
+        connections.close_all()
+
+
+def render_image_variants(model, pk, field_name, variants_field_name, name, on_stored=None):
+    """
+    Renders the variants of `name` and stores them if the instance still uses that file,
+    then deletes the variants of the previous file.
+    """
+    instance = model.objects.filter(pk=pk).only(field_name, variants_field_name).first()
+    if instance is None:
+        return
+    field_file = getattr(instance, field_name)
+    if (field_file.name or None) != name:
+        return
+    try:
+        variants = generate_image_variants(field_file) if name else {}
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.warning("Could not render image variants of %s", name, exc_info=True)
+        return
+    filters = {field_name: name} if name else {}
+    if _store_variants(model, pk, variants_field_name, variants, filters):
+        delete_image_variants(field_file.storage, getattr(instance, variants_field_name))
+        if on_stored is not None:
+            on_stored()
+    else:
+        delete_image_variants(field_file.storage, variants)
+
+
+def _store_variants(model, pk, variants_field_name, variants, filters):
+    """
+    Writes the variants with an UPDATE that bypasses the model signals and returns
+    whether the row still matched. `auto_now` fields are bumped like `save()` would,
+    so conditional GETs see the change.
+    """
+    updates = {variants_field_name: variants}
+    for field in model._meta.concrete_fields:
+        if getattr(field, 'auto_now', False):
+            updates[field.name] = timezone.now()
+    return model.objects.filter(pk=pk, **filters).update(**updates) > 0
+
+
+def delete_image_variants(storage, variants):
+    """Deletes the stored variant files."""
+    for name in (variants or {}).get('files', {}).values():
+        storage.delete(name)
+
+
+def image_variant_urls(variants, storage, request=None):
+    """
+    Returns the URLs of stored variants by name, absolute if a request is available.
+    """
+    urls = {}
+    for variant, name in (variants or {}).get('files', {}).items():
+        url = storage.url(name)
+        urls[variant] = request.build_absolute_uri(url) if request is not None else url
+    return urls
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only field exposing the variant URLs stored by `schedule_image_variants`.
+    Empty until the background rendering finished.
+    """
+
+    def __init__(self, storage, **kwargs):
+        self.storage = storage
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return image_variant_urls(value, self.storage, self.context.get('request'))
@@ -0,0 +1,195 @@
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks directly to the last seen row using a unique ordering.
+    Pages are fetched with a `WHERE (field, id) > (value, last_id)` condition instead of
+    OFFSET, and no COUNT query is executed.
+    Subclasses define the ordering by overriding `get_ordering`.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the ordering as a list of `(field_name, descending)` tuples.
+        The last field must be unique and not nullable, usually `id`.
+        """
+        return [('id', False)]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns the rows of the requested page and remembers the positions
+        of the surrounding pages for the response links.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.nullable = self._get_nullable_fields(queryset)
+        position, reverse = self.decode_cursor(request)
+
+        rows = self.get_page_rows(
+            queryset, position, reverse, self.page_size + 1)
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = True if reverse else has_more
+        has_previous = has_more if reverse else position is not None
+        self.next_position = self.get_position(
+            rows[-1]) if has_next and rows else None
+        self.previous_position = self.get_position(
+            rows[0]) if has_previous and rows else None
+        return rows
+
+    def get_page_rows(self, queryset, position, reverse, limit):
+        """
+        Fetches up to `limit` rows following `position` in scan direction.
+        """
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position, reverse))
+        return list(queryset.order_by(*self.get_order_by(reverse))[:limit])
+
+    def get_order_by(self, reverse):
+        """
+        Returns order expressions for the scan direction, keeping NULLs at the end of the forward order.
+        """
+        null_placement = {'nulls_first': True} if reverse else {'nulls_last': True}
+        expressions = []
+        for field, descending in self.ordering:
+            nulls = null_placement if field in self.nullable else {}
+            if descending != reverse:
+                expressions.append(F(field).desc(**nulls))
+            else:
+                expressions.append(F(field).asc(**nulls))
+        return expressions
+
+    def get_position_filter(self, position, reverse):
+        """
+        Builds the lexicographic condition selecting all rows after `position` in scan direction.
+        """
+        condition = Q(pk__in=[])
+        for index, (field, descending) in enumerate(self.ordering):
+            step = self._field_after(
+                field, descending, position[index], reverse)
+            if step is None:
+                continue
+            for prior_index, (prior_field, _) in enumerate(self.ordering[:index]):
+                step &= self._field_equals(prior_field, position[prior_index])
+            condition |= step
+        return condition
+
+    def _field_after(self, field, descending, value, reverse):
+        """Returns the condition for a single field being past `value`, or None if nothing can follow."""
+        nullable = field in self.nullable
+        if value is None:
+            return Q(**{f'{field}__isnull': False}) if reverse else None
+        lookup = 'lt' if descending != reverse else 'gt'
+        condition = Q(**{f'{field}__{lookup}': value})
+        if nullable and not reverse:
+            condition |= Q(**{f'{field}__isnull': True})
+        return condition
+
+    def _field_equals(self, field, value):
+        """Returns the condition for a single field being equal to `value`."""
+        if value is None:
+            return Q(**{f'{field}__isnull': True})
+        return Q(**{field: value})
+
+    def _get_nullable_fields(self, queryset):
+        """Returns the names of ordering fields that may contain NULL."""
+        opts = queryset.model._meta
+        return {field for field, _ in self.ordering if opts.get_field(field).null}
+
+    def get_position(self, row):
+        """Extracts the ordering values from a model instance or values() dict."""
+        if isinstance(row, dict):
+            return [row[field] for field, _ in self.ordering]
+        return [getattr(row, field) for field, _ in self.ordering]
+
+    def get_page_size(self, request):
+        """
+        Returns the page size from the query parameter, capped at `max_page_size`.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        """
+        Returns the `(position, reverse)` encoded in the cursor query parameter.
+        Raises NotFound for cursors that are malformed or belong to another ordering.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            data = json.loads(b64decode(encoded.encode('ascii')).decode('utf-8'))
+            fields, position, reverse = data['f'], list(data['p']), bool(data['r'])
+        except (TypeError, ValueError, KeyError, UnicodeError, BinasciiError):
+            raise NotFound(self.invalid_cursor_message)
+        if fields != [field for field, _ in self.ordering] or len(position) != len(fields):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        """
+        Returns the page URL for an opaque cursor pointing at `position`.
+        """
+        data = {
+            'f': [field for field, _ in self.ordering],
+            'p': [value.isoformat() if hasattr(value, 'isoformat') else value
+                  for value in position],
+            'r': int(reverse),
+        }
+        encoded = b64encode(json.dumps(data).encode('utf-8')).decode('ascii')
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        """Returns the URL of the next page or None on the last page."""
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        """Returns the URL of the previous page or None on the first page."""
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        """Returns the page with next/previous links and without a total count."""
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,90 @@
+from rest_framework import serializers
+
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+
+
+def _split_names(value):
+    """Splits a comma separated query parameter into field names."""
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def get_sparse_fieldset(request, field_names):
+    """
+    Returns the names from `field_names` selected with `?fields=` and not excluded
+    with `?omit=`, in their original order.
+    Returns None if neither parameter is given or the request is not a read,
+    so writes always respond with the full representation. Unknown names are ignored.
+    """
+    if request is None or request.method not in ('GET', 'HEAD'):
+        return None
+    params = getattr(request, 'query_params', request.GET)
+    fields = params.get(FIELDS_QUERY_PARAM)
+    omit = params.get(OMIT_QUERY_PARAM)
+    if not fields and not omit:
+        return None
+    selected = _split_names(fields) if fields else set(field_names)
+    selected -= _split_names(omit or '')
+    return [name for name in field_names if name in selected]
+
+
+def get_context_request(context):
+    """Returns the request from a serializer context, falling back to the view's request."""
+    request = context.get('request')
+    if request is None:
+        request = getattr(context.get('view'), 'request', None)
+    return request
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for `?fields=` / `?omit=` on read requests.
+    Only the top-level serializer is reduced; nested serializers keep their fields.
+
+    `get_sparse_queryset` prunes the queryset to the columns the selected fields read.
+    Fields map to the model column of the same name unless listed in
+    `sparse_field_columns`; columns on related models (`user__username`) are loaded
+    with `select_related`, which replaces any relations the queryset selected before.
+    `sparse_required_columns` are always loaded.
+    """
+    sparse_field_columns = {}
+    sparse_required_columns = ['id']
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_sparse_root():
+            return fields
+        selected = get_sparse_fieldset(get_context_request(self.context), list(fields))
+        if selected is None:
+            return fields
+        return {name: fields[name] for name in selected}
+
+    def _is_sparse_root(self):
+        """Returns whether this serializer renders the top-level objects of the response."""
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    @classmethod
+    def get_sparse_fields(cls, request):
+        """Returns the selected field names of this serializer, or None for the full representation."""
+        return get_sparse_fieldset(request, list(cls.Meta.fields))
+
+    @classmethod
+    def get_sparse_queryset(cls, queryset, request):
+        """
+        Restricts the queryset to the columns of the selected fields.
+        Returns the queryset unchanged if no sparse fieldset was requested.
+        """
+        selected = cls.get_sparse_fields(request)
+        if selected is None:
+            return queryset
+        columns = set(cls.sparse_required_columns)
+        for name in selected:
+            columns.update(cls.sparse_field_columns.get(name, [name]))
+        related = {column.rsplit('__', 1)[0] for column in columns if '__' in column}
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*columns)
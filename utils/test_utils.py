@@ -1,4 +1,8 @@
+from io import BytesIO
+
 from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
 from rest_framework.authtoken.models import Token
 from users_auth_app.models import UserProfile
 
@@ -28,3 +32,10 @@ class TestHelper:
     def auth_client(client, token):
         """Sets the auth header for a test client."""
         client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+    @staticmethod
+    def create_image_upload(name='bild.png', size=(800, 400)):
+        """Returns an uploaded PNG file of the given size."""
+        buffer = BytesIO()
+        Image.new('RGB', size, 'red').save(buffer, 'PNG')
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')